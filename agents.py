@@ -1,9 +1,18 @@
 """
 Jarvis Agent Definitions
 Creates specialized agents using LangGraph's create_react_agent.
+
+Model and agent factories are memoized: building a ChatAnthropic/
+ChatGoogleGenerativeAI instance and compiling a react graph is expensive
+(HTTP client setup, pydantic validation), so repeated calls return the
+same objects.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langgraph.prebuilt import create_react_agent
 
@@ -17,12 +26,14 @@ from prompts import (
 )
 
 
+@lru_cache(maxsize=1)
 def get_claude_model() -> ChatAnthropic:
     """Get Claude model instance."""
     return ChatAnthropic(
         model=Config.CLAUDE_MODEL,
         api_key=Config.ANTHROPIC_API_KEY,
         max_tokens=4096,
+        default_headers={"anthropic-beta": "prompt-caching-2024-07-31"},
     )
 
 
@@ -33,6 +44,7 @@ def get_coding_model():
     return get_claude_model()
 
 
+@lru_cache(maxsize=1)
 def get_gemini_model() -> ChatGoogleGenerativeAI:
     """Get Gemini model instance."""
     return ChatGoogleGenerativeAI(
@@ -44,6 +56,52 @@ def get_gemini_model() -> ChatGoogleGenerativeAI:
     )
 
 
+@lru_cache(maxsize=1)
+def get_batched_claude_model():
+    """Get a micro-batching proxy over the Claude model.
+
+    For fan-out callers that issue several short prompts concurrently
+    (not for create_react_agent, which needs the raw chat model).
+    """
+    from batching import BatchedModelProxy
+
+    return BatchedModelProxy(get_claude_model())
+
+
+@lru_cache(maxsize=1)
+def get_batched_gemini_model():
+    """Get a micro-batching proxy over the Gemini model."""
+    from batching import BatchedModelProxy
+
+    return BatchedModelProxy(get_gemini_model())
+
+
+def _cacheable_prompt(text: str) -> SystemMessage:
+    """Mark a static system prompt as an Anthropic prompt-cache breakpoint.
+
+    The agent prompts are long and identical across turns, so caching the
+    prefix cuts input-token cost (~90%) and time-to-first-token on every
+    call after the first.
+    """
+    return SystemMessage(
+        content=[
+            {
+                "type": "text",
+                "text": text,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+    )
+
+
+def _coding_prompt(text: str):
+    """System prompt for coding agents - cacheable only on Claude."""
+    if getattr(Config, "USE_GEMINI_ONLY", False):
+        return text
+    return _cacheable_prompt(text)
+
+
+@lru_cache(maxsize=1)
 def create_prompt_refiner():
     """Create the prompt refinement agent (Gemini)."""
     return create_react_agent(
@@ -54,36 +112,40 @@ def create_prompt_refiner():
     )
 
 
+@lru_cache(maxsize=1)
 def create_backend_agent():
     """Create the backend development agent (Claude)."""
     return create_react_agent(
         model=get_coding_model(),
         tools=[],  # Phase 1: No tools. Later: file read/write, shell exec
         name="backend_agent",
-        prompt=BACKEND_AGENT_PROMPT,
+        prompt=_coding_prompt(BACKEND_AGENT_PROMPT),
     )
 
 
+@lru_cache(maxsize=1)
 def create_frontend_agent():
     """Create the frontend development agent (Claude)."""
     return create_react_agent(
         model=get_coding_model(),
         tools=[],
         name="frontend_agent",
-        prompt=FRONTEND_AGENT_PROMPT,
+        prompt=_coding_prompt(FRONTEND_AGENT_PROMPT),
     )
 
 
+@lru_cache(maxsize=1)
 def create_devops_agent():
     """Create the DevOps/infrastructure agent (Claude)."""
     return create_react_agent(
         model=get_coding_model(),
         tools=[],
         name="devops_agent",
-        prompt=DEVOPS_AGENT_PROMPT,
+        prompt=_coding_prompt(DEVOPS_AGENT_PROMPT),
     )
 
 
+@lru_cache(maxsize=1)
 def create_pr_reviewer():
     """Create the PR review agent (Gemini)."""
     return create_react_agent(
@@ -94,12 +156,26 @@ def create_pr_reviewer():
     )
 
 
+@lru_cache(maxsize=1)
+def _all_agents() -> tuple:
+    """Build every specialized agent once and keep them for reuse.
+
+    The five factories are independent and mostly block on HTTP client
+    init, so build them concurrently: cold-start cost drops from the sum
+    of the five to the slowest one.
+    """
+    factories = (
+        create_prompt_refiner,
+        create_backend_agent,
+        create_frontend_agent,
+        create_devops_agent,
+        create_pr_reviewer,
+    )
+    with ThreadPoolExecutor(max_workers=len(factories)) as executor:
+        futures = [executor.submit(factory) for factory in factories]
+        return tuple(future.result() for future in futures)
+
+
 def create_all_agents() -> list:
     """Create all specialized agents."""
-    return [
-        create_prompt_refiner(),
-        create_backend_agent(),
-        create_frontend_agent(),
-        create_devops_agent(),
-        create_pr_reviewer(),
-    ]
+    return list(_all_agents())
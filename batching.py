@@ -0,0 +1,69 @@
+"""
+Jarvis LLM Micro-Batching
+Coalesces concurrent same-model prompts into single batch calls.
+"""
+
+import asyncio
+from typing import Optional
+
+
+class BatchedModelProxy:
+    """
+    Wraps a LangChain chat model and coalesces concurrent `ainvoke` calls.
+
+    Callers enqueue their prompt and await a future; a background drainer
+    collects up to `max_batch` prompts within `max_wait_ms` and issues one
+    `model.abatch` call, then routes each result back to its caller. This
+    amortizes the fixed per-call overhead when several agents fan out
+    short prompts to the same model at once.
+    """
+
+    def __init__(self, model, max_batch: int = 8, max_wait_ms: float = 10.0):
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._drainer: Optional[asyncio.Task] = None
+
+    def _ensure_drainer(self):
+        """Start the background drain task on first use."""
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.get_running_loop().create_task(self._drain())
+
+    async def ainvoke(self, messages):
+        """Enqueue a prompt and await its result from the next batch."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._ensure_drainer()
+        await self._queue.put((messages, future))
+        return await future
+
+    async def _drain(self):
+        """Collect queued prompts into batches and dispatch them."""
+        while True:
+            batch = [await self._queue.get()]
+
+            # Keep collecting until the window closes or the batch is full
+            deadline = asyncio.get_running_loop().time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            inputs = [messages for messages, _ in batch]
+            try:
+                results = await self.model.abatch(inputs)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
@@ -3,15 +3,21 @@
 Jarvis CLI - Command-line interface with memory support.
 Supports both simple mode and multi-agent mode.
 """
+import asyncio
 import sys
+import time
+from functools import lru_cache
 from uuid import uuid4
 
 from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.table import Table
 
 from config import Config
+from semantic_cache import SemanticCache
+
+try:
+    from prompt_toolkit import PromptSession
+except ImportError:  # Optional - fall back to blocking input()
+    PromptSession = None
 
 console = Console()
 
@@ -25,13 +31,12 @@ AGENT_COLORS = {
     "pr_reviewer": "red",
 }
 
+QUIT_COMMANDS = ("quit", "exit", "q", "/quit")
 
-def print_welcome():
-    """Print welcome message."""
-    mode = Config.print_status()
-    model = Config.GEMINI_MODEL if Config.USE_GEMINI_ONLY else Config.CLAUDE_MODEL
+GOODBYE = "\n[dim]JARVIS powering down. Memories preserved, Sir.[/dim]"
 
-    welcome = f"""
+
+_WELCOME_TEMPLATE = """
 # JARVIS v0.2.0
 
 Good evening, Sir. JARVIS online with memory systems active.
@@ -41,7 +46,7 @@ Good evening, Sir. JARVIS online with memory systems active.
 
 **Commands:**
 - `/clear` - Clear session history
-- `/memory` - Show memory statistics  
+- `/memory` - Show memory statistics
 - `/patterns` - Show detected patterns
 - `/sessions` - List past sessions
 - `/recall <query>` - Search memories
@@ -50,24 +55,302 @@ Good evening, Sir. JARVIS online with memory systems active.
 
 Type your request to begin.
 """
-    console.print(
-        Panel(
-            Markdown(welcome),
-            title="[bold blue]JARVIS[/bold blue]",
-            border_style="blue",
-        )
+
+
+@lru_cache(maxsize=4)
+def _welcome_panel(mode: str, model: str):
+    """Build the welcome Panel once per (mode, model); the Markdown
+    parse is not free."""
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
+    return Panel(
+        Markdown(_WELCOME_TEMPLATE.format(mode=mode, model=model)),
+        title="[bold blue]JARVIS[/bold blue]",
+        border_style="blue",
     )
 
 
+def print_welcome():
+    """Print welcome message."""
+    model = Config.GEMINI_MODEL if Config.USE_GEMINI_ONLY else Config.CLAUDE_MODEL
+    console.print(_welcome_panel(Config.print_status(), model))
+
+
+# Streaming chunks are written in batches: Rich's markup parsing and a
+# stdout flush per token dominate render time on long answers.
+_FLUSH_CHUNKS = 8
+_FLUSH_SECONDS = 0.03
+
+
+def write_stream(chunks) -> str:
+    """Write stream chunks to stdout in batches, returning the full text.
+
+    Flushes on every newline, every _FLUSH_CHUNKS chunks, or every
+    _FLUSH_SECONDS seconds - whichever comes first.
+    """
+    parts = []
+    buf = []
+    last_flush = time.monotonic()
+
+    for chunk in chunks:
+        parts.append(chunk)
+        buf.append(chunk)
+        now = time.monotonic()
+        if len(buf) >= _FLUSH_CHUNKS or now - last_flush > _FLUSH_SECONDS or "\n" in chunk:
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
+            buf.clear()
+            last_flush = now
+
+    if buf:
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
+
+    return "".join(parts)
+
+
+# Sentinel marking the end of a producer stream
+_STREAM_DONE = object()
+
+
+async def write_stream_async(chunks) -> str:
+    """Async variant of write_stream that overlaps network RX with writes.
+
+    The blocking chunk generator runs on a worker thread and feeds an
+    asyncio.Queue; the event loop drains it with the same batched-flush
+    policy. The network socket is never idle while stdout is being
+    written, which write_stream's in-thread loop cannot avoid.
+    """
+    loop = asyncio.get_running_loop()
+    q: asyncio.Queue = asyncio.Queue()
+
+    def _produce():
+        try:
+            for chunk in chunks:
+                loop.call_soon_threadsafe(q.put_nowait, chunk)
+        finally:
+            loop.call_soon_threadsafe(q.put_nowait, _STREAM_DONE)
+
+    producer = loop.run_in_executor(None, _produce)
+
+    parts = []
+    buf = []
+    last_flush = time.monotonic()
+    while True:
+        chunk = await q.get()
+        if chunk is _STREAM_DONE:
+            break
+        parts.append(chunk)
+        buf.append(chunk)
+        now = time.monotonic()
+        if len(buf) >= _FLUSH_CHUNKS or now - last_flush > _FLUSH_SECONDS or "\n" in chunk:
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
+            buf.clear()
+            last_flush = now
+
+    if buf:
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
+
+    # Surfaces any exception the generator raised mid-stream
+    await producer
+
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
 def format_agent_name(agent_type) -> str:
-    """Format agent name with color."""
+    """Format agent name with color.
+
+    Cached per agent: the hasattr probe and markup build run once, and
+    every later event in the hot render loops is a dict hit.
+    """
     name = agent_type.value if hasattr(agent_type, "value") else str(agent_type)
     color = AGENT_COLORS.get(name, "white")
     return f"[bold {color}]{name}[/bold {color}]"
 
 
+# Live Markdown refreshes are throttled: each update re-parses the whole
+# buffer, so we only refresh on newlines or every _LIVE_REFRESH_SECONDS.
+_LIVE_REFRESH_SECONDS = 0.1
+
+
+def stream_agents_markdown(events) -> str:
+    """Render a (agent_type, chunk) stream as live-updating Markdown.
+
+    Chunks accumulate into a per-agent buffer; the Markdown is re-rendered
+    only on newline boundaries or every _LIVE_REFRESH_SECONDS, and
+    finalized once when the active agent changes. Keeps full Markdown
+    formatting without a parse per token. Returns the full rendered text
+    so callers can cache it.
+    """
+    from rich.live import Live
+    from rich.markdown import Markdown
+
+    current_agent = None
+    buf = []
+    all_parts = []
+    live = None
+    last_render = 0.0
+
+    try:
+        for agent_type, chunk in events:
+            if agent_type != current_agent:
+                if live is not None:
+                    live.update(Markdown("".join(buf)))
+                    live.stop()
+                    live = None
+                    console.print()
+                current_agent = agent_type
+                buf = []
+                console.print(f"{format_agent_name(agent_type)}:")
+                live = Live(
+                    Markdown(""),
+                    console=console,
+                    refresh_per_second=10,
+                    vertical_overflow="visible",
+                )
+                live.start()
+                last_render = 0.0
+
+            buf.append(chunk)
+            all_parts.append(chunk)
+            now = time.monotonic()
+            if "\n" in chunk or now - last_render > _LIVE_REFRESH_SECONDS:
+                live.update(Markdown("".join(buf)))
+                last_render = now
+    finally:
+        if live is not None:
+            live.update(Markdown("".join(buf)))
+            live.stop()
+
+    return "".join(all_parts)
+
+
+# -----------------------------------------------------------------------------
+# Command handlers
+#
+# Commands are dispatched through a dict keyed on the first (lowered) token,
+# so each loop iteration lowers the input once and does a single O(1) lookup
+# instead of walking an if/elif chain. Handlers take the active jarvis/workflow
+# object and the remainder of the input line.
+# -----------------------------------------------------------------------------
+
+
+# Column specs for the command tables, declared once at module scope so
+# each invocation only pays for row data, not column setup literals.
+_MEMORY_COLS = (("Metric", "cyan"), ("Value", "green"))
+_SESSION_COLS = (
+    ("Session ID", "cyan"),
+    ("Started", "green"),
+    ("Messages", "yellow"),
+)
+_PATTERN_COLS = (("Type", "cyan"), ("Pattern", "green"), ("Frequency", "yellow"))
+
+
+def _make_table(title: str, cols=()):
+    """Build a Rich Table from a (name, style) column spec."""
+    from rich.table import Table
+
+    table = Table(title=title)
+    for name, style in cols:
+        table.add_column(name, style=style)
+    return table
+
+
+def _cmd_memory(target, arg: str):
+    """Show memory statistics."""
+    stats = target.get_memory_stats()
+    table = _make_table("Memory Statistics", _MEMORY_COLS)
+    table.add_row("Total Messages", str(stats["total_messages"]))
+    table.add_row("Total Sessions", str(stats["total_sessions"]))
+    table.add_row("Tracked Patterns", str(stats["total_patterns"]))
+    table.add_row("Embedded Chunks", str(stats["embedded_chunks"]))
+    console.print(table)
+    console.print()
+
+
+def _cmd_sessions(target, arg: str):
+    """List past sessions."""
+    sessions = target.memory.get_all_sessions(limit=10)
+    if sessions:
+        table = _make_table("Past Sessions", _SESSION_COLS)
+        for s in sessions:
+            table.add_row(
+                s["session_id"][:8] + "...",
+                s["started"][:16] if s["started"] else "N/A",
+                str(s["message_count"]),
+            )
+        console.print(table)
+    else:
+        console.print("[dim]No past sessions found, Sir.[/dim]")
+    console.print()
+
+
+def _cmd_recall(target, arg: str):
+    """Search memories semantically."""
+    query = arg.strip()
+    if query:
+        contents, _, relevances = target.memory.recall(query, n_results=5)
+        if contents:
+            console.print(f"\n[bold]Memories related to '{query}':[/bold]\n")
+            for i, (content, relevance) in enumerate(zip(contents, relevances), 1):
+                console.print(f"[dim]{i}. ({relevance:.0%} match)[/dim]")
+                console.print(f"   {content[:200]}...\n")
+        else:
+            console.print("[dim]No relevant memories found, Sir.[/dim]")
+    console.print()
+
+
+async def _read_input(
+    prompt_session, prompt_markup: str, prompt_plain: str = "You: "
+) -> str:
+    """Read one line without blocking the event loop.
+
+    Uses prompt_toolkit's async prompt when installed; otherwise runs the
+    blocking input() on a worker thread. Either way, background tasks
+    (memory warmup, cache maintenance) keep running while the user types.
+    """
+    if prompt_session is not None:
+        return (await prompt_session.prompt_async(prompt_plain)).strip()
+    console.print(prompt_markup, end="")
+    return (await asyncio.to_thread(input)).strip()
+
+
+# Sentinel returned by dispatch_command for quit requests
+QUIT = object()
+
+
+def dispatch_command(handlers: dict, target, user_input: str):
+    """Match input against quit words and the command handler table.
+
+    Shared by both mode loops so the parsing/dispatch logic exists once.
+    Returns QUIT for a quit request, True if a command handler ran, and
+    False when the input is regular chat.
+    """
+    # Lower the input once; commands resolve on the first token and
+    # handlers get the original-case remainder.
+    lowered = user_input.lower()
+    if lowered in QUIT_COMMANDS:
+        return QUIT
+
+    head, sep, _ = lowered.partition(" ")
+    handler = handlers.get(head)
+    if handler is None:
+        return False
+    handler(target, user_input[len(head) + 1 :] if sep else "")
+    return True
+
+
 def run_simple_mode():
     """Run simple single-agent mode with memory."""
+    asyncio.run(_simple_mode_loop())
+
+
+async def _simple_mode_loop():
+    """Async driver for simple mode."""
     from simple_workflow import SimpleJarvis
 
     session_id = str(uuid4())
@@ -75,130 +358,118 @@ def run_simple_mode():
 
     jarvis = SimpleJarvis(session_id=session_id)
 
+    # Semantic cache: replay answers for repeats/paraphrases of past queries
+    response_cache = SemanticCache(
+        embed_fn=jarvis.memory._get_embedding,
+        threshold=Config.SEMANTIC_CACHE_THRESHOLD,
+        ttl=Config.SEMANTIC_CACHE_TTL,
+    )
+
+    prompt_session = PromptSession() if PromptSession is not None else None
+
+    # Warm memory and the embedding path while the user types their
+    # first message
+    warm_task = asyncio.create_task(asyncio.to_thread(jarvis.warmup))
+
     stats = jarvis.get_memory_stats()
     if stats["total_messages"] > 0:
         console.print(
             f"[dim]Memory: {stats['total_messages']} messages across {stats['total_sessions']} sessions[/dim]\n"
         )
 
+    def _cmd_clear(target, arg: str):
+        target.clear_history()
+        console.print(
+            "[dim]Session history cleared. Persistent memory intact, Sir.[/dim]\n"
+        )
+
+    def _cmd_patterns(target, arg: str):
+        patterns = target.get_patterns(limit=10)
+        if patterns:
+            table = _make_table("Detected Patterns", _PATTERN_COLS)
+            for p in patterns:
+                table.add_row(
+                    p["pattern_type"],
+                    p["pattern_data"],
+                    str(p["frequency"]),
+                )
+            console.print(table)
+        else:
+            console.print("[dim]No patterns detected yet, Sir. Keep chatting.[/dim]")
+        console.print()
+
+    def _cmd_mode(target, arg: str):
+        console.print(f"[dim]Current mode: {Config.print_status()}[/dim]\n")
+
+    handlers = {
+        "/clear": _cmd_clear,
+        "/memory": _cmd_memory,
+        "/patterns": _cmd_patterns,
+        "/sessions": _cmd_sessions,
+        "/recall": _cmd_recall,
+        "/mode": _cmd_mode,
+    }
+
     try:
         while True:
             try:
-                console.print("[bold blue]You:[/bold blue] ", end="")
-                user_input = input().strip()
+                user_input = await _read_input(
+                    prompt_session, "[bold blue]You:[/bold blue] "
+                )
 
                 if not user_input:
                     continue
 
-                if user_input.lower() in ("quit", "exit", "q", "/quit"):
-                    console.print(
-                        "\n[dim]JARVIS powering down. Memories preserved, Sir.[/dim]"
-                    )
+                action = dispatch_command(handlers, jarvis, user_input)
+                if action is QUIT:
+                    console.print(GOODBYE)
                     break
-
-                if user_input.lower() == "/clear":
-                    jarvis.clear_history()
-                    console.print(
-                        "[dim]Session history cleared. Persistent memory intact, Sir.[/dim]\n"
-                    )
-                    continue
-
-                if user_input.lower() == "/memory":
-                    stats = jarvis.get_memory_stats()
-                    table = Table(title="Memory Statistics")
-                    table.add_column("Metric", style="cyan")
-                    table.add_column("Value", style="green")
-                    table.add_row("Total Messages", str(stats["total_messages"]))
-                    table.add_row("Total Sessions", str(stats["total_sessions"]))
-                    table.add_row("Tracked Patterns", str(stats["total_patterns"]))
-                    table.add_row("Embedded Chunks", str(stats["embedded_chunks"]))
-                    console.print(table)
-                    console.print()
-                    continue
-
-                if user_input.lower() == "/patterns":
-                    patterns = jarvis.get_patterns()
-                    if patterns:
-                        table = Table(title="Detected Patterns")
-                        table.add_column("Type", style="cyan")
-                        table.add_column("Pattern", style="green")
-                        table.add_column("Frequency", style="yellow")
-                        for p in patterns[:10]:
-                            table.add_row(
-                                p["pattern_type"],
-                                p["pattern_data"],
-                                str(p["frequency"]),
-                            )
-                        console.print(table)
-                    else:
-                        console.print(
-                            "[dim]No patterns detected yet, Sir. Keep chatting.[/dim]"
-                        )
-                    console.print()
-                    continue
-
-                if user_input.lower() == "/sessions":
-                    sessions = jarvis.memory.get_all_sessions()
-                    if sessions:
-                        table = Table(title="Past Sessions")
-                        table.add_column("Session ID", style="cyan")
-                        table.add_column("Started", style="green")
-                        table.add_column("Messages", style="yellow")
-                        for s in sessions[:10]:
-                            table.add_row(
-                                s["session_id"][:8] + "...",
-                                s["started"][:16] if s["started"] else "N/A",
-                                str(s["message_count"]),
-                            )
-                        console.print(table)
-                    else:
-                        console.print("[dim]No past sessions found, Sir.[/dim]")
-                    console.print()
-                    continue
-
-                if user_input.lower().startswith("/recall "):
-                    query = user_input[8:].strip()
-                    if query:
-                        memories = jarvis.memory.recall(query, n_results=5)
-                        if memories:
-                            console.print(
-                                f"\n[bold]Memories related to '{query}':[/bold]\n"
-                            )
-                            for i, mem in enumerate(memories, 1):
-                                relevance = f"{mem['relevance']:.0%}"
-                                console.print(f"[dim]{i}. ({relevance} match)[/dim]")
-                                console.print(f"   {mem['content'][:200]}...\n")
-                        else:
-                            console.print("[dim]No relevant memories found, Sir.[/dim]")
-                    console.print()
-                    continue
-
-                if user_input.lower() == "/mode":
-                    console.print(f"[dim]Current mode: {Config.print_status()}[/dim]\n")
+                if action:
                     continue
 
                 # Regular chat
                 console.print("\n[bold green]JARVIS:[/bold green]")
 
                 try:
-                    for chunk in jarvis.stream(user_input):
-                        console.print(chunk, end="")
-                    console.print("\n")
+                    cached = response_cache.lookup(user_input, session_id=session_id)
+                    if cached is not None:
+                        # Raw write like the streaming path: LLM output may
+                        # contain [brackets] Rich would eat as markup
+                        sys.stdout.write(cached + "\n")
+                        sys.stdout.flush()
+                        console.print()
+                        # Keep history/memory consistent with what was shown
+                        jarvis.record_exchange(user_input, cached)
+                    else:
+                        full_response = await write_stream_async(
+                            jarvis.stream(user_input)
+                        )
+                        response_cache.put(
+                            user_input, full_response, session_id=session_id
+                        )
+                        console.print("\n")
                 except Exception as e:
                     console.print(f"\n[red]Error: {e}[/red]")
                     console.print("[dim]Attempting to continue...[/dim]\n")
 
             except KeyboardInterrupt:
-                console.print(
-                    "\n\n[dim]JARVIS powering down. Memories preserved, Sir.[/dim]"
-                )
+                console.print("\n" + GOODBYE)
                 break
     finally:
+        if not warm_task.done():
+            warm_task.cancel()
         jarvis.close()
 
 
 def run_multi_agent_mode():
     """Run full multi-agent mode with routing and review."""
+    asyncio.run(_multi_agent_loop())
+
+
+async def _multi_agent_loop():
+    """Async driver for multi-agent mode."""
+    from rich.markdown import Markdown
+
     from workflow import MultiAgentWorkflow, AgentType
 
     session_id = str(uuid4())
@@ -207,134 +478,146 @@ def run_multi_agent_mode():
     workflow = MultiAgentWorkflow(session_id=session_id)
     fast_mode = False  # Toggle with /fast
 
+    # Semantic cache over the full user-visible answer (specialist
+    # output + summary): repeats and paraphrases skip the pipeline
+    response_cache = SemanticCache(
+        embed_fn=workflow.memory._get_embedding,
+        threshold=Config.SEMANTIC_CACHE_THRESHOLD,
+        ttl=Config.SEMANTIC_CACHE_TTL,
+    )
+
+    prompt_session = PromptSession() if PromptSession is not None else None
+
+    # Warm memory and the embedding path while the user types their
+    # first request
+    warm_task = asyncio.create_task(asyncio.to_thread(workflow.warmup))
+
     stats = workflow.get_memory_stats()
     if stats["total_messages"] > 0:
         console.print(
             f"[dim]Memory: {stats['total_messages']} messages across {stats['total_sessions']} sessions[/dim]\n"
         )
 
+    def _cmd_fast(target, arg: str):
+        nonlocal fast_mode
+        fast_mode = not fast_mode
+        status = "enabled" if fast_mode else "disabled"
+        console.print(
+            f"[dim]Fast mode {status}. {'Skipping refiner and reviewer.' if fast_mode else 'Full pipeline active.'}[/dim]\n"
+        )
+
+    def _cmd_mode(target, arg: str):
+        console.print(
+            f"[dim]Current mode: {Config.print_status()} | Fast: {fast_mode}[/dim]\n"
+        )
+
+    handlers = {
+        "/fast": _cmd_fast,
+        "/memory": _cmd_memory,
+        "/sessions": _cmd_sessions,
+        "/recall": _cmd_recall,
+        "/mode": _cmd_mode,
+    }
+
     try:
         while True:
             try:
                 mode_indicator = "[fast]" if fast_mode else ""
-                console.print(f"[bold blue]You{mode_indicator}:[/bold blue] ", end="")
-                user_input = input().strip()
+                user_input = await _read_input(
+                    prompt_session,
+                    f"[bold blue]You{mode_indicator}:[/bold blue] ",
+                    f"You{mode_indicator}: ",
+                )
 
                 if not user_input:
                     continue
 
-                # Commands
-                if user_input.lower() in ("quit", "exit", "q", "/quit"):
-                    console.print(
-                        "\n[dim]JARVIS powering down. Memories preserved, Sir.[/dim]"
-                    )
+                action = dispatch_command(handlers, workflow, user_input)
+                if action is QUIT:
+                    console.print(GOODBYE)
                     break
-
-                if user_input.lower() == "/fast":
-                    fast_mode = not fast_mode
-                    status = "enabled" if fast_mode else "disabled"
-                    console.print(
-                        f"[dim]Fast mode {status}. {'Skipping refiner and reviewer.' if fast_mode else 'Full pipeline active.'}[/dim]\n"
-                    )
-                    continue
-
-                if user_input.lower() == "/memory":
-                    stats = workflow.get_memory_stats()
-                    table = Table(title="Memory Statistics")
-                    table.add_column("Metric", style="cyan")
-                    table.add_column("Value", style="green")
-                    table.add_row("Total Messages", str(stats["total_messages"]))
-                    table.add_row("Total Sessions", str(stats["total_sessions"]))
-                    table.add_row("Tracked Patterns", str(stats["total_patterns"]))
-                    table.add_row("Embedded Chunks", str(stats["embedded_chunks"]))
-                    console.print(table)
-                    console.print()
-                    continue
-
-                if user_input.lower() == "/sessions":
-                    sessions = workflow.memory.get_all_sessions()
-                    if sessions:
-                        table = Table(title="Past Sessions")
-                        table.add_column("Session ID", style="cyan")
-                        table.add_column("Started", style="green")
-                        table.add_column("Messages", style="yellow")
-                        for s in sessions[:10]:
-                            table.add_row(
-                                s["session_id"][:8] + "...",
-                                s["started"][:16] if s["started"] else "N/A",
-                                str(s["message_count"]),
-                            )
-                        console.print(table)
-                    else:
-                        console.print("[dim]No past sessions found, Sir.[/dim]")
-                    console.print()
-                    continue
-
-                if user_input.lower().startswith("/recall "):
-                    query = user_input[8:].strip()
-                    if query:
-                        memories = workflow.memory.recall(query, n_results=5)
-                        if memories:
-                            console.print(
-                                f"\n[bold]Memories related to '{query}':[/bold]\n"
-                            )
-                            for i, mem in enumerate(memories, 1):
-                                relevance = f"{mem['relevance']:.0%}"
-                                console.print(f"[dim]{i}. ({relevance} match)[/dim]")
-                                console.print(f"   {mem['content'][:200]}...\n")
-                        else:
-                            console.print("[dim]No relevant memories found, Sir.[/dim]")
-                    console.print()
-                    continue
-
-                if user_input.lower() == "/mode":
-                    console.print(
-                        f"[dim]Current mode: {Config.print_status()} | Fast: {fast_mode}[/dim]\n"
-                    )
+                if action:
                     continue
 
                 # Process request
                 console.print()
 
                 try:
-                    if fast_mode:
-                        # Streaming fast mode
-                        current_agent = None
-                        for agent_type, chunk in workflow.stream_fast(user_input):
-                            if agent_type != current_agent:
-                                if current_agent is not None:
-                                    console.print("\n")
-                                current_agent = agent_type
-                                console.print(f"{format_agent_name(agent_type)}:")
-                            console.print(chunk, end="")
+                    cached = response_cache.lookup(user_input, session_id=session_id)
+                    if cached is not None:
+                        console.print(f"{format_agent_name('supervisor')}:")
+                        console.print(Markdown(cached))
+                        console.print()
+                    elif fast_mode:
+                        # Streaming fast mode: buffered live Markdown
+                        fast_text = stream_agents_markdown(
+                            workflow.stream_fast(user_input)
+                        )
+                        if fast_text:
+                            response_cache.put(
+                                user_input, fast_text, session_id=session_id
+                            )
                         console.print("\n")
                     else:
-                        # Full workflow
+                        # Full workflow. Intermediate agent output goes out as
+                        # plain text; only the supervisor's closing summary is
+                        # worth a full Markdown parse/render.
+                        # Cache the user-visible deliverable: the specialist
+                        # output plus the supervisor summary, not the summary
+                        # alone (it deliberately omits the code it refers to).
+                        specialist_parts = []
+                        summary = None
                         for response in workflow.run(user_input, skip_review=False):
                             if response.metadata.get("status") == "starting":
                                 console.print(
                                     f"{format_agent_name(response.agent)}: [dim]processing...[/dim]"
                                 )
+                            elif response.metadata.get("delta"):
+                                # Specialist tokens stream as they arrive
+                                specialist_parts.append(response.content)
+                                sys.stdout.write(response.content)
+                                sys.stdout.flush()
+                            elif response.metadata.get("status") == "complete":
+                                sys.stdout.write("\n")
+                                sys.stdout.flush()
+                                console.print()
                             elif response.content:
                                 console.print(f"\n{format_agent_name(response.agent)}:")
-                                console.print(Markdown(response.content))
+                                if response.agent == AgentType.SUPERVISOR:
+                                    console.print(Markdown(response.content))
+                                    summary = response.content
+                                else:
+                                    sys.stdout.write(response.content + "\n")
+                                    sys.stdout.flush()
                                 console.print()
 
+                        specialist_text = "".join(specialist_parts)
+                        if specialist_text and summary:
+                            composite = f"{specialist_text}\n\n---\n\n{summary}"
+                        else:
+                            composite = specialist_text or summary
+                        if composite:
+                            response_cache.put(
+                                user_input, composite, session_id=session_id
+                            )
+
                 except Exception as e:
                     console.print(f"[red]Error: {e}[/red]")
                     console.print("[dim]Attempting to continue...[/dim]\n")
 
             except KeyboardInterrupt:
-                console.print(
-                    "\n\n[dim]JARVIS powering down. Memories preserved, Sir.[/dim]"
-                )
+                console.print("\n" + GOODBYE)
                 break
     finally:
+        if not warm_task.done():
+            warm_task.cancel()
         workflow.close()
 
 
 def run_cli():
     """Main entry point - picks mode based on config."""
+    Config.validate()
+    Config.ensure_dirs()
     print_welcome()
 
     if Config.SIMPLE_MODE:
@@ -0,0 +1,40 @@
+"""
+Jarvis Shared API Clients
+One google-genai client (and its HTTP connection pool) for the process.
+"""
+
+import threading
+from typing import Optional
+
+from google import genai
+from google.genai import types
+
+from config import Config
+
+_client: Optional[genai.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_genai_client() -> genai.Client:
+    """Get the process-wide Gemini client.
+
+    Each component used to build its own client, each carrying its own
+    TLS handshake and connection pool. Sharing one keeps connections warm
+    across agents, memory, and workflows. Lazy init is guarded by a lock
+    so concurrent first calls (background warmup vs. the main thread)
+    build exactly one client.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = genai.Client(
+                    api_key=Config.GOOGLE_API_KEY,
+                    # Compressed responses matter most for embedding calls,
+                    # whose float payloads compress well; connections are
+                    # already pooled and kept alive by the SDK's httpx client
+                    http_options=types.HttpOptions(
+                        headers={"Accept-Encoding": "gzip"}
+                    ),
+                )
+    return _client
@@ -14,6 +14,18 @@ class Config:
     CLAUDE_MODEL: str = os.getenv("CLAUDE_MODEL", "claude-sonnet-4-20250514")
     GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
 
+    # Semantic response cache
+    SEMANTIC_CACHE_THRESHOLD: float = float(
+        os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.9")
+    )
+    SEMANTIC_CACHE_TTL: float = float(os.getenv("SEMANTIC_CACHE_TTL", "300"))
+
+    # Specialist responses shorter than this (and with no code block)
+    # skip the PR-review and final-summary steps in the full workflow
+    REVIEW_MIN_RESPONSE_CHARS: int = int(
+        os.getenv("REVIEW_MIN_RESPONSE_CHARS", "400")
+    )
+
     # Mode flags
     USE_GEMINI_ONLY: bool = os.getenv("USE_GEMINI_ONLY", "false").lower() == "true"
     USE_CLAUDE_ONLY: bool = os.getenv("USE_CLAUDE_ONLY", "false").lower() == "true"
@@ -23,8 +35,20 @@ class Config:
     PROJECT_ROOT: Path = Path(__file__).parent
     DATA_DIR: Path = PROJECT_ROOT / "data"
 
+    # Mode label, computed once at import instead of per print_status call
+    PROVIDER_LABEL: str = (
+        f"Simple Mode ({'Claude' if USE_CLAUDE_ONLY and not USE_GEMINI_ONLY else 'Gemini'})"
+        if SIMPLE_MODE
+        else "Multi-Agent Mode"
+    )
+
+    _validated: bool = False
+    _dirs_ensured: bool = False
+
     @classmethod
     def validate(cls) -> None:
+        if cls._validated:
+            return
         errors = []
         if cls.USE_GEMINI_ONLY and not cls.GOOGLE_API_KEY:
             errors.append("GOOGLE_API_KEY not set")
@@ -35,24 +59,17 @@ class Config:
 
         if errors:
             raise ValueError(f"Configuration errors: {', '.join(errors)}")
+        cls._validated = True
 
     @classmethod
     def ensure_dirs(cls) -> None:
-        """Create necessary directories."""
+        """Create necessary directories (idempotent, stat-free on repeats)."""
+        if cls._dirs_ensured:
+            return
         cls.DATA_DIR.mkdir(parents=True, exist_ok=True)
+        cls._dirs_ensured = True
 
     @classmethod
     def print_status(cls) -> str:
         """Return current mode status."""
-        if cls.SIMPLE_MODE:
-            provider = (
-                "Gemini"
-                if cls.USE_GEMINI_ONLY
-                else "Claude" if cls.USE_CLAUDE_ONLY else "Gemini"
-            )
-            return f"Simple Mode ({provider})"
-        return "Multi-Agent Mode"
-
-
-Config.validate()
-Config.ensure_dirs()
+        return cls.PROVIDER_LABEL
@@ -1,40 +1,116 @@
 """
 Jarvis Memory System
-Combines SQLite (structured) + ChromaDB (semantic) for persistent memory.
+Combines SQLite (structured) + an in-memory NumPy vector index (semantic)
+for persistent memory.
 """
 
+import hashlib
 import json
+import queue
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import chromadb
-from chromadb.config import Settings
-from google import genai
+import numpy as np
 
+from clients import get_genai_client
 from config import Config
 
+# Hot-path SQL hoisted to module scope: one shared string per statement
+# keeps sqlite3's per-connection statement cache warm across calls.
+_SQL_INSERT_CONV = "INSERT INTO conversations (session_id, role, content, timestamp, metadata) VALUES (?, ?, ?, ?, ?)"
+_SQL_INSERT_EMBEDDING = "INSERT OR REPLACE INTO embeddings (doc_id, session_id, timestamp, user_message, content, vec) VALUES (?, ?, ?, ?, ?, ?)"
+_SQL_CACHE_EMBEDDING = "INSERT OR REPLACE INTO embedding_cache (hash, vec) VALUES (?, ?)"
+_SQL_PATTERN_UPSERT = """
+    INSERT INTO patterns (pattern_type, pattern_data) VALUES (?, ?)
+    ON CONFLICT(pattern_type, pattern_data)
+    DO UPDATE SET frequency = frequency + 1, last_seen = CURRENT_TIMESTAMP
+"""
+_SQL_RECENT_HISTORY = """
+    SELECT role, content, timestamp
+    FROM conversations
+    WHERE session_id = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+_SQL_ALL_SESSIONS = """
+    SELECT
+        session_id,
+        MIN(timestamp) as started,
+        MAX(timestamp) as last_active,
+        COUNT(*) as message_count
+    FROM conversations
+    GROUP BY session_id
+    ORDER BY last_active DESC
+"""
+
+
+def _unit(vec) -> np.ndarray:
+    """L2-normalize a vector so cosine similarity reduces to a dot product."""
+    v = np.asarray(vec, dtype=np.float32)
+    return v / (np.linalg.norm(v) + 1e-12)
+
+
+def _ts_to_iso(value) -> str:
+    """Render a stored timestamp for display.
+
+    New rows hold integer epoch microseconds; rows written by older
+    builds hold ISO strings and pass through unchanged.
+    """
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1e6).isoformat()
+    return value
+
 
 class MemoryManager:
     """
     Manages Jarvis's memory across conversations.
 
-    - SQLite: Stores full conversation history with metadata
-    - ChromaDB: Stores embeddings for semantic retrieval
+    - SQLite: Stores full conversation history, metadata, and embeddings
+    - NumPy: Mirrors the embeddings in memory for brute-force cosine recall
+
+    At this workload's scale (thousands of chunks), a flat NumPy scan
+    beats a persistent HNSW index on both latency and memory, and avoids
+    the cold-start index rebuild entirely.
     """
 
     def __init__(self, db_path: Optional[Path] = None):
+        # Config checks run here (first real use) rather than at import
+        Config.validate()
+        Config.ensure_dirs()
+
         self.db_path = db_path or Config.DATA_DIR / "jarvis_memory.db"
-        self.chroma_path = Config.DATA_DIR / "chroma"
 
-        # Initialize Gemini client for embeddings
-        self.genai_client = genai.Client(api_key=Config.GOOGLE_API_KEY)
+        # One writer at a time: the connection is shared across threads
+        # (background writers, the index worker, embedding cache fills)
+        # and sqlite3 serializes statements but not transactions - an
+        # unguarded commit/rollback in one thread could commit or discard
+        # another thread's in-flight rows. Every transactional write
+        # block takes this lock first so each transaction has one owner.
+        self._db_lock = threading.Lock()
+
+        # Shared Gemini client for embeddings
+        self.genai_client = get_genai_client()
         self.embedding_model = "text-embedding-004"
 
-        # Initialize databases
+        # In-process embedding LRU; backed by the on-disk embedding_cache
+        # table so repeat texts never hit the network, even across runs
+        self._embed_lru: OrderedDict = OrderedDict()
+        self._embed_lru_max = 4096
+
+        # Initialize database and the in-memory vector index
         self._init_sqlite()
-        self._init_chromadb()
+        self._init_vector_index()
+
+        # Background worker: embedding + vector-index writes happen off
+        # the caller's thread so store() returns once SQLite is durable.
+        self._index_queue: queue.Queue = queue.Queue()
+        self._index_worker = threading.Thread(target=self._index_loop, daemon=True)
+        self._index_worker.start()
 
     def _init_sqlite(self):
         """Initialize SQLite database for structured storage."""
@@ -43,6 +119,15 @@ class MemoryManager:
         self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
 
+        # WAL + relaxed sync: commits become WAL appends instead of full
+        # fsyncs. Safe for a local single-user assistant DB.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        self.conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+        self.conn.execute("PRAGMA cache_spill=0")
+
         self.conn.executescript(
             """
             CREATE TABLE IF NOT EXISTS conversations (
@@ -50,7 +135,7 @@ class MemoryManager:
                 session_id TEXT NOT NULL,
                 role TEXT NOT NULL,
                 content TEXT NOT NULL,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                timestamp INTEGER NOT NULL,
                 metadata TEXT
             );
             
@@ -65,39 +150,287 @@ class MemoryManager:
                 first_seen DATETIME DEFAULT CURRENT_TIMESTAMP,
                 last_seen DATETIME DEFAULT CURRENT_TIMESTAMP
             );
-            
+
+            -- Collapse duplicates from databases created before the
+            -- unique index existed, otherwise the CREATE INDEX fails
+            DELETE FROM patterns WHERE id NOT IN (
+                SELECT MIN(id) FROM patterns GROUP BY pattern_type, pattern_data
+            );
+
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_pattern_unique
+                ON patterns(pattern_type, pattern_data);
+
             CREATE TABLE IF NOT EXISTS summaries (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 session_id TEXT NOT NULL,
                 summary TEXT NOT NULL,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP
             );
+
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                hash TEXT PRIMARY KEY,
+                vec BLOB NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS embeddings (
+                doc_id TEXT PRIMARY KEY,
+                session_id TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                user_message TEXT,
+                content TEXT NOT NULL,
+                vec BLOB NOT NULL
+            );
         """
         )
         self.conn.commit()
 
-    def _init_chromadb(self):
-        """Initialize ChromaDB for semantic search."""
-        self.chroma_path.mkdir(parents=True, exist_ok=True)
+        # Vectors are stored as unit-normalized float16 since schema
+        # version 1: half the blob bytes for negligible cosine error at
+        # the 0.5 relevance cutoff. Migrate float32 blobs from older
+        # builds once, tracked via user_version.
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+            with self._db_lock, self.conn:
+                for table, key in (
+                    ("embeddings", "doc_id"),
+                    ("embedding_cache", "hash"),
+                ):
+                    rows = self.conn.execute(f"SELECT {key}, vec FROM {table}").fetchall()
+                    self.conn.executemany(
+                        f"UPDATE {table} SET vec = ? WHERE {key} = ?",
+                        (
+                            (
+                                _unit(np.frombuffer(row["vec"], dtype=np.float32))
+                                .astype(np.float16)
+                                .tobytes(),
+                                row[key],
+                            )
+                            for row in rows
+                        ),
+                    )
+                self.conn.execute("PRAGMA user_version = 1")
+
+        # Conversation timestamps are integer epoch microseconds since
+        # schema version 2. Older builds wrote ISO strings, and SQLite
+        # orders all TEXT above all INTEGER - mixing the two corrupts
+        # ORDER BY timestamp (and MAX(timestamp)) on upgraded databases,
+        # so rewrite the TEXT rows once.
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < 2:
+            with self._db_lock, self.conn:
+                rows = self.conn.execute(
+                    "SELECT id, timestamp FROM conversations"
+                    " WHERE typeof(timestamp) = 'text'"
+                ).fetchall()
+                updates = []
+                for row in rows:
+                    try:
+                        ts = datetime.fromisoformat(row["timestamp"])
+                    except ValueError:
+                        continue
+                    updates.append((int(ts.timestamp() * 1e6), row["id"]))
+                self.conn.executemany(
+                    "UPDATE conversations SET timestamp = ? WHERE id = ?", updates
+                )
+                self.conn.execute("PRAGMA user_version = 2")
+
+    def _init_vector_index(self):
+        """Load stored embeddings into the in-memory index."""
+        self._vec_lock = threading.Lock()
+        self._vec_matrix: Optional[np.ndarray] = None  # (capacity, dim) float16
+        self._vec_count = 0
+        self._vec_meta: list[dict] = []
+
+        rows = self.conn.execute(
+            "SELECT session_id, timestamp, user_message, content, vec FROM embeddings"
+        ).fetchall()
+        for row in rows:
+            self._append_vector(
+                np.frombuffer(row["vec"], dtype=np.float16),
+                row["content"],
+                {
+                    "session_id": row["session_id"],
+                    "timestamp": row["timestamp"],
+                    "user_message": row["user_message"],
+                },
+            )
 
-        self.chroma_client = chromadb.PersistentClient(
-            path=str(self.chroma_path),
-            settings=Settings(anonymized_telemetry=False),
-        )
+    def _append_vector(self, vec: np.ndarray, content: str, meta: dict):
+        """Append one embedding to the index, growing capacity as needed.
 
-        # Collection for conversation chunks
-        self.collection = self.chroma_client.get_or_create_collection(
-            name="jarvis_memory",
-            metadata={"hnsw:space": "cosine"},
-        )
+        Rows are unit-normalized on the way in (covers raw vectors written
+        by older builds), so recall is a pure dot product - no per-row
+        norm, divide, or sqrt during the scan.
+        """
+        vec = _unit(vec)
+        with self._vec_lock:
+            if self._vec_matrix is None:
+                capacity = 1024
+                # float16 halves the bytes scanned per query; at a 0.5+
+                # relevance cutoff the ~3 decimal digits it keeps are plenty
+                self._vec_matrix = np.zeros((capacity, vec.shape[0]), dtype=np.float16)
+            elif self._vec_count == self._vec_matrix.shape[0]:
+                # Double capacity so appends stay amortized O(1)
+                self._vec_matrix = np.concatenate(
+                    [self._vec_matrix, np.zeros_like(self._vec_matrix)]
+                )
+
+            self._vec_matrix[self._vec_count] = vec.astype(np.float16)
+            self._vec_meta.append({"content": content, "metadata": meta})
+            self._vec_count += 1
 
     def _get_embedding(self, text: str) -> list[float]:
-        """Generate embedding using Gemini."""
-        result = self.genai_client.models.embed_content(
-            model=self.embedding_model,
-            contents=text,
-        )
-        return result.embeddings[0].values
+        """Generate embedding using Gemini, cached in memory and on disk.
+
+        Repeat texts (common for CLI re-asks) skip the 100-300ms network
+        round-trip: first via an in-process LRU, then via the
+        embedding_cache table keyed by SHA-256 of the text.
+        """
+        key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+        cached = self._embed_lru.get(key)
+        if cached is not None:
+            self._embed_lru.move_to_end(key)
+            return cached
+
+        row = self.conn.execute(
+            "SELECT vec FROM embedding_cache WHERE hash = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            # Blobs are unit fp16 (migrated at startup), so read is a cast
+            vec = np.frombuffer(row["vec"], dtype=np.float16).astype(np.float32).tolist()
+        else:
+            result = self.genai_client.models.embed_content(
+                model=self.embedding_model,
+                contents=text,
+            )
+            # Unit-normalize before caching: downstream cosine math is
+            # then a plain dot product
+            vec = _unit(result.embeddings[0].values).tolist()
+            with self._db_lock, self.conn:
+                self.conn.execute(
+                    _SQL_CACHE_EMBEDDING,
+                    (key, np.asarray(vec, dtype=np.float16).tobytes()),
+                )
+
+        self._embed_lru[key] = vec
+        while len(self._embed_lru) > self._embed_lru_max:
+            self._embed_lru.popitem(last=False)
+        return vec
+
+    def _get_embeddings_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed many texts in as few API calls as possible.
+
+        embed_content accepts a list of contents, so bulk paths (imports,
+        reindexing) pay ceil(N/100) round-trips instead of N. Cached
+        texts are served locally; only the misses go over the wire.
+        """
+        vectors: list[Optional[list[float]]] = [None] * len(texts)
+        misses: list[int] = []
+
+        for i, text in enumerate(texts):
+            key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            cached = self._embed_lru.get(key)
+            if cached is not None:
+                self._embed_lru.move_to_end(key)
+                vectors[i] = cached
+                continue
+            row = self.conn.execute(
+                "SELECT vec FROM embedding_cache WHERE hash = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                # Blobs are unit fp16 (migrated at startup)
+                vectors[i] = (
+                    np.frombuffer(row["vec"], dtype=np.float16)
+                    .astype(np.float32)
+                    .tolist()
+                )
+            else:
+                misses.append(i)
+
+        # Gemini caps contents per request; 100 keeps us well under it
+        for start in range(0, len(misses), 100):
+            chunk = misses[start : start + 100]
+            result = self.genai_client.models.embed_content(
+                model=self.embedding_model,
+                contents=[texts[i] for i in chunk],
+            )
+            for i, emb in zip(chunk, result.embeddings):
+                vectors[i] = _unit(emb.values).tolist()
+
+        # Write everything back through both cache tiers
+        cache_rows = []
+        for text, vec in zip(texts, vectors):
+            key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            cache_rows.append((key, np.asarray(vec, dtype=np.float16).tobytes()))
+            self._embed_lru[key] = vec
+        while len(self._embed_lru) > self._embed_lru_max:
+            self._embed_lru.popitem(last=False)
+        with self._db_lock, self.conn:
+            self.conn.executemany(_SQL_CACHE_EMBEDDING, cache_rows)
+
+        return vectors
+
+    def reindex_all(self):
+        """Rebuild the semantic index from the conversations table.
+
+        Pairs user/assistant rows by (session_id, timestamp) and embeds
+        all exchanges with batched API calls, then replaces both the
+        embeddings table and the in-memory matrix. Useful after changing
+        the embedding model or importing history in bulk.
+        """
+        rows = self.conn.execute(
+            "SELECT session_id, timestamp, role, content FROM conversations ORDER BY timestamp"
+        ).fetchall()
+
+        exchanges: dict[tuple, dict] = {}
+        for row in rows:
+            exchanges.setdefault(
+                (row["session_id"], row["timestamp"]), {}
+            )[row["role"]] = row["content"]
+
+        docs = []
+        for (session_id, timestamp), parts in exchanges.items():
+            if "user" not in parts or "assistant" not in parts:
+                continue
+            combined = f"User: {parts['user']}\nJarvis: {parts['assistant']}"
+            docs.append((session_id, timestamp, parts["user"], combined))
+
+        embeddings = self._get_embeddings_batch([doc[3] for doc in docs])
+
+        with self._db_lock, self.conn:
+            self.conn.execute("DELETE FROM embeddings")
+            self.conn.executemany(
+                _SQL_INSERT_EMBEDDING,
+                [
+                    (
+                        f"{session_id}_{timestamp}",
+                        session_id,
+                        timestamp,
+                        user_message[:500],
+                        combined,
+                        np.asarray(vec, dtype=np.float16).tobytes(),
+                    )
+                    for (session_id, timestamp, user_message, combined), vec in zip(
+                        docs, embeddings
+                    )
+                ],
+            )
+
+        with self._vec_lock:
+            self._vec_matrix = None
+            self._vec_count = 0
+            self._vec_meta = []
+        for (session_id, timestamp, user_message, combined), vec in zip(
+            docs, embeddings
+        ):
+            self._append_vector(
+                np.asarray(vec, dtype=np.float32),
+                combined,
+                {
+                    "session_id": session_id,
+                    "timestamp": timestamp,
+                    "user_message": user_message[:500],
+                },
+            )
 
     def store(
         self,
@@ -115,22 +448,81 @@ class MemoryManager:
             assistant_response: Jarvis's response
             metadata: Optional additional metadata
         """
-        timestamp = datetime.now().isoformat()
+        # Integer epoch microseconds: one clock read per exchange, and
+        # cheaper for SQLite to store, compare, and index than ISO text
+        timestamp = time.time_ns() // 1000
         meta_json = json.dumps(metadata) if metadata else None
 
-        # Store in SQLite
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "INSERT INTO conversations (session_id, role, content, timestamp, metadata) VALUES (?, ?, ?, ?, ?)",
-            (session_id, "user", user_message, timestamp, meta_json),
-        )
-        cursor.execute(
-            "INSERT INTO conversations (session_id, role, content, timestamp, metadata) VALUES (?, ?, ?, ?, ?)",
-            (session_id, "assistant", assistant_response, timestamp, meta_json),
-        )
-        self.conn.commit()
+        # Store in SQLite - both rows in one statement, one commit/fsync
+        with self._db_lock, self.conn:
+            self.conn.executemany(
+                _SQL_INSERT_CONV,
+                [
+                    (session_id, "user", user_message, timestamp, meta_json),
+                    (
+                        session_id,
+                        "assistant",
+                        assistant_response,
+                        timestamp,
+                        meta_json,
+                    ),
+                ],
+            )
 
-        # Store in ChromaDB for semantic search
+        self._index_queue.put((session_id, timestamp, user_message, assistant_response))
+
+    def store_batch(
+        self,
+        exchanges: list[tuple[str, str, str]],
+        metadata: Optional[dict] = None,
+    ):
+        """
+        Store many exchanges in a single transaction.
+
+        For bulk imports and session replays: 2N rows go in with one
+        commit instead of N commits, amortizing the fsync cost.
+
+        Args:
+            exchanges: List of (session_id, user_message, assistant_response)
+            metadata: Optional metadata applied to every exchange
+        """
+        meta_json = json.dumps(metadata) if metadata else None
+
+        rows = []
+        indexed = []
+        for session_id, user_message, assistant_response in exchanges:
+            timestamp = time.time_ns() // 1000
+            rows.append((session_id, "user", user_message, timestamp, meta_json))
+            rows.append(
+                (session_id, "assistant", assistant_response, timestamp, meta_json)
+            )
+            indexed.append((session_id, timestamp, user_message, assistant_response))
+
+        with self._db_lock, self.conn:
+            self.conn.executemany(_SQL_INSERT_CONV, rows)
+
+        for item in indexed:
+            self._index_queue.put(item)
+
+    def _index_loop(self):
+        """Worker loop: drain the index queue until shutdown."""
+        while True:
+            item = self._index_queue.get()
+            try:
+                if item is None:
+                    break
+                self._index_exchange(*item)
+            finally:
+                self._index_queue.task_done()
+
+    def _index_exchange(
+        self,
+        session_id: str,
+        timestamp: int,
+        user_message: str,
+        assistant_response: str,
+    ):
+        """Embed an exchange and add it to the semantic index."""
         # Combine user + assistant for context
         combined = f"User: {user_message}\nJarvis: {assistant_response}"
 
@@ -140,17 +532,28 @@ class MemoryManager:
             # Use timestamp as unique ID
             doc_id = f"{session_id}_{timestamp}"
 
-            self.collection.add(
-                ids=[doc_id],
-                embeddings=[embedding],
-                documents=[combined],
-                metadatas=[
-                    {
-                        "session_id": session_id,
-                        "timestamp": timestamp,
-                        "user_message": user_message[:500],  # Truncate for metadata
-                    }
-                ],
+            vec = np.asarray(embedding, dtype=np.float32)
+            with self._db_lock, self.conn:
+                self.conn.execute(
+                    _SQL_INSERT_EMBEDDING,
+                    (
+                        doc_id,
+                        session_id,
+                        timestamp,
+                        user_message[:500],  # Truncate for metadata
+                        combined,
+                        vec.astype(np.float16).tobytes(),
+                    ),
+                )
+
+            self._append_vector(
+                vec,
+                combined,
+                {
+                    "session_id": session_id,
+                    "timestamp": timestamp,
+                    "user_message": user_message[:500],
+                },
             )
         except Exception as e:
             # Don't fail if embedding fails - SQLite still has the data
@@ -161,7 +564,8 @@ class MemoryManager:
         query: str,
         n_results: int = 5,
         session_id: Optional[str] = None,
-    ) -> list[dict]:
+        as_dicts: bool = False,
+    ):
         """
         Recall relevant memories based on semantic similarity.
 
@@ -169,46 +573,54 @@ class MemoryManager:
             query: The query to search for
             n_results: Number of results to return
             session_id: Optional filter by session
+            as_dicts: Return the legacy list-of-dicts form instead of
+                parallel arrays
 
         Returns:
-            List of relevant memory chunks with metadata
+            (contents, metadatas, relevances) parallel sequences sorted by
+            descending relevance - structure-of-arrays avoids a dict
+            allocation per hit in this hot path. With as_dicts=True,
+            a list of {content, metadata, relevance} dicts.
         """
-        try:
-            embedding = self._get_embedding(query)
-
-            where_filter = {"session_id": session_id} if session_id else None
-
-            results = self.collection.query(
-                query_embeddings=[embedding],
-                n_results=n_results,
-                where=where_filter,
-                include=["documents", "metadatas", "distances"],
-            )
-
-            memories = []
-            if results["documents"] and results["documents"][0]:
-                for i, doc in enumerate(results["documents"][0]):
-                    memories.append(
-                        {
-                            "content": doc,
-                            "metadata": (
-                                results["metadatas"][0][i]
-                                if results["metadatas"]
-                                else {}
-                            ),
-                            "relevance": (
-                                1 - results["distances"][0][i]
-                                if results["distances"]
-                                else 0
-                            ),
-                        }
-                    )
+        contents: list[str] = []
+        metadatas: list[dict] = []
+        relevances: list[float] = []
 
-            return memories
+        try:
+            with self._vec_lock:
+                count = self._vec_count
+                matrix = self._vec_matrix[:count] if count else None
+
+            if count:
+                q = np.asarray(self._get_embedding(query), dtype=np.float32)
+
+                # Rows and query are unit vectors, so one matrix-vector
+                # product is the cosine score for every stored chunk; keeping
+                # the query in float16 too avoids upcasting the matrix
+                sims = (matrix @ q.astype(np.float16)).astype(np.float32)
+
+                # Top-k first, full sort only over the k survivors
+                k = min(n_results if not session_id else count, count)
+                top = np.argpartition(-sims, k - 1)[:k] if k < count else np.arange(count)
+                for idx in top[np.argsort(-sims[top])]:
+                    entry = self._vec_meta[idx]
+                    if session_id and entry["metadata"]["session_id"] != session_id:
+                        continue
+                    contents.append(entry["content"])
+                    metadatas.append(entry["metadata"])
+                    relevances.append(float(sims[idx]))
+                    if len(contents) >= n_results:
+                        break
 
         except Exception as e:
             print(f"Warning: Failed to recall memories: {e}")
-            return []
+
+        if as_dicts:
+            return [
+                {"content": c, "metadata": m, "relevance": r}
+                for c, m, r in zip(contents, metadatas, relevances)
+            ]
+        return contents, metadatas, relevances
 
     def get_recent_history(
         self,
@@ -216,37 +628,28 @@ class MemoryManager:
         limit: int = 10,
     ) -> list[dict]:
         """Get recent conversation history from SQLite."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT role, content, timestamp 
-            FROM conversations 
-            WHERE session_id = ? 
-            ORDER BY timestamp DESC 
-            LIMIT ?
-            """,
-            (session_id, limit),
-        )
-
-        rows = cursor.fetchall()
+        rows = self.conn.execute(_SQL_RECENT_HISTORY, (session_id, limit)).fetchall()
         return [dict(row) for row in reversed(rows)]
 
-    def get_all_sessions(self) -> list[dict]:
-        """Get all conversation sessions."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT 
-                session_id,
-                MIN(timestamp) as started,
-                MAX(timestamp) as last_active,
-                COUNT(*) as message_count
-            FROM conversations 
-            GROUP BY session_id
-            ORDER BY last_active DESC
-            """
-        )
-        return [dict(row) for row in cursor.fetchall()]
+    def get_all_sessions(self, limit: Optional[int] = None) -> list[dict]:
+        """Get conversation sessions, most recent first.
+
+        Args:
+            limit: Optional cap on rows - pushed into SQL so the query
+                does O(limit) work instead of materializing every session
+        """
+        if limit is not None:
+            rows = self.conn.execute(_SQL_ALL_SESSIONS + " LIMIT ?", (limit,))
+        else:
+            rows = self.conn.execute(_SQL_ALL_SESSIONS)
+
+        sessions = []
+        for row in rows.fetchall():
+            session = dict(row)
+            session["started"] = _ts_to_iso(session["started"])
+            session["last_active"] = _ts_to_iso(session["last_active"])
+            sessions.append(session)
+        return sessions
 
     def track_pattern(self, pattern_type: str, pattern_data: str):
         """
@@ -256,77 +659,111 @@ class MemoryManager:
             pattern_type: Type of pattern (e.g., 'topic', 'time_of_day', 'task_type')
             pattern_data: The pattern value
         """
-        cursor = self.conn.cursor()
-
-        # Check if pattern exists
-        cursor.execute(
-            "SELECT id, frequency FROM patterns WHERE pattern_type = ? AND pattern_data = ?",
-            (pattern_type, pattern_data),
-        )
-        existing = cursor.fetchone()
+        # Single upsert instead of SELECT-then-UPDATE/INSERT
+        with self._db_lock, self.conn:
+            self.conn.execute(_SQL_PATTERN_UPSERT, (pattern_type, pattern_data))
 
-        if existing:
-            cursor.execute(
-                "UPDATE patterns SET frequency = frequency + 1, last_seen = CURRENT_TIMESTAMP WHERE id = ?",
-                (existing["id"],),
-            )
-        else:
-            cursor.execute(
-                "INSERT INTO patterns (pattern_type, pattern_data) VALUES (?, ?)",
-                (pattern_type, pattern_data),
-            )
+    def track_patterns(self, patterns: list[tuple[str, str]]):
+        """
+        Track several patterns in one transaction.
 
-        self.conn.commit()
+        Args:
+            patterns: (pattern_type, pattern_data) pairs, e.g. from one
+                message's keyword scan. One commit covers them all
+                instead of a write per pattern.
+        """
+        if not patterns:
+            return
+        with self._db_lock, self.conn:
+            self.conn.executemany(_SQL_PATTERN_UPSERT, patterns)
 
     def get_patterns(
-        self, pattern_type: Optional[str] = None, min_frequency: int = 2
+        self,
+        pattern_type: Optional[str] = None,
+        min_frequency: int = 2,
+        limit: Optional[int] = None,
     ) -> list[dict]:
         """Get tracked patterns, optionally filtered by type."""
-        cursor = self.conn.cursor()
-
         if pattern_type:
-            cursor.execute(
-                """
-                SELECT * FROM patterns 
+            sql = """
+                SELECT * FROM patterns
                 WHERE pattern_type = ? AND frequency >= ?
                 ORDER BY frequency DESC
-                """,
-                (pattern_type, min_frequency),
-            )
-        else:
-            cursor.execute(
                 """
-                SELECT * FROM patterns 
+            params: tuple = (pattern_type, min_frequency)
+        else:
+            sql = """
+                SELECT * FROM patterns
                 WHERE frequency >= ?
                 ORDER BY frequency DESC
-                """,
-                (min_frequency,),
-            )
+                """
+            params = (min_frequency,)
+
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
 
-        return [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in self.conn.execute(sql, params).fetchall()]
 
     def get_stats(self) -> dict:
         """Get memory statistics."""
-        cursor = self.conn.cursor()
+        total_messages = self.conn.execute(
+            "SELECT COUNT(*) as total FROM conversations"
+        ).fetchone()["total"]
 
-        cursor.execute("SELECT COUNT(*) as total FROM conversations")
-        total_messages = cursor.fetchone()["total"]
+        total_sessions = self.conn.execute(
+            "SELECT COUNT(DISTINCT session_id) as total FROM conversations"
+        ).fetchone()["total"]
 
-        cursor.execute("SELECT COUNT(DISTINCT session_id) as total FROM conversations")
-        total_sessions = cursor.fetchone()["total"]
+        total_patterns = self.conn.execute(
+            "SELECT COUNT(*) as total FROM patterns"
+        ).fetchone()["total"]
 
-        cursor.execute("SELECT COUNT(*) as total FROM patterns")
-        total_patterns = cursor.fetchone()["total"]
-
-        chroma_count = self.collection.count()
+        with self._vec_lock:
+            embedded_chunks = self._vec_count
 
         return {
             "total_messages": total_messages,
             "total_sessions": total_sessions,
             "total_patterns": total_patterns,
-            "embedded_chunks": chroma_count,
+            "embedded_chunks": embedded_chunks,
         }
 
     def close(self):
-        """Close database connections."""
+        """Flush pending index work and close database connections."""
+        self._index_queue.join()
+        self._index_queue.put(None)
+        self._index_worker.join()
         self.conn.close()
+
+
+# Process-wide shared MemoryManager. Each instance carries a SQLite
+# connection, the vector index, and the embedding caches - sharing one
+# across sessions amortizes all of that. Closing is reference-counted so
+# a session tearing down does not yank the manager from the others.
+_shared_memory: Optional[MemoryManager] = None
+_shared_refs = 0
+_shared_lock = threading.Lock()
+
+
+def acquire_shared_memory() -> MemoryManager:
+    """Get the process-wide MemoryManager, creating it on first use."""
+    global _shared_memory, _shared_refs
+    with _shared_lock:
+        if _shared_memory is None:
+            _shared_memory = MemoryManager()
+        _shared_refs += 1
+        return _shared_memory
+
+
+def release_shared_memory():
+    """Drop one reference; the manager closes when the last one goes."""
+    global _shared_memory, _shared_refs
+    with _shared_lock:
+        if _shared_memory is None:
+            return
+        _shared_refs -= 1
+        if _shared_refs <= 0:
+            _shared_memory.close()
+            _shared_memory = None
+            _shared_refs = 0
@@ -0,0 +1,150 @@
+"""
+Jarvis Semantic Cache
+Short-circuits repeated LLM calls by matching new queries against
+previously answered ones via embedding similarity.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Embedding-based response cache with an exact-match L1 tier.
+
+    Lookups check an exact-match LRU first (sub-millisecond, no embedding
+    call), then fall back to cosine similarity against stored query
+    embeddings with `threshold`. Embeddings live in a preallocated
+    float16 ring buffer, L2-normalized at insert, so a lookup is one
+    matrix-vector product instead of a Python loop over entry lists -
+    half precision is plenty for a 0.9 similarity threshold and halves
+    the bytes scanned. Query embeddings are memoized in an LRU so
+    re-asked queries skip the embedding API call entirely.
+    Entries expire after `ttl` seconds and each tier holds at most
+    `max_entries` entries (oldest evicted first).
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], list[float]],
+        threshold: float = 0.9,
+        ttl: float = 300.0,
+        max_entries: int = 256,
+    ):
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        # Semantic tier: ring buffer of normalized vectors + parallel metadata.
+        # The matrix is allocated on first put, once the embedding dim is known.
+        self._vectors: Optional[np.ndarray] = None
+        self._responses: list = [None] * max_entries
+        self._sessions: list = [None] * max_entries
+        self._stored_at = np.zeros(max_entries, dtype=np.float64)
+        self._size = 0
+        self._next = 0
+
+        # L1: exact (normalized query, session) -> (response, stored_at)
+        self._exact: OrderedDict = OrderedDict()
+
+        # Query-embedding LRU: re-asked queries skip the API round-trip
+        self._embed_lru: OrderedDict = OrderedDict()
+        self._embed_lru_max = max_entries
+
+    @staticmethod
+    def _normalize(vec) -> np.ndarray:
+        v = np.asarray(vec, dtype=np.float32)
+        norm = np.linalg.norm(v)
+        if norm > 0:
+            v = v / norm
+        return v.astype(np.float16)
+
+    def _embed(self, query: str) -> np.ndarray:
+        """Embed a query, memoized in an LRU keyed on the raw text."""
+        cached = self._embed_lru.get(query)
+        if cached is not None:
+            self._embed_lru.move_to_end(query)
+            return cached
+
+        embedding = self._normalize(self.embed_fn(query))
+        self._embed_lru[query] = embedding
+        while len(self._embed_lru) > self._embed_lru_max:
+            self._embed_lru.popitem(last=False)
+        return embedding
+
+    @staticmethod
+    def _exact_key(query: str, session_id: Optional[str]) -> tuple:
+        return (query.strip().lower(), session_id)
+
+    def lookup(self, query: str, session_id: Optional[str] = None) -> Optional[str]:
+        """
+        Return a cached response for a repeated or similar query, or None.
+
+        Args:
+            query: The incoming user query
+            session_id: Optional namespace - only match entries from this session
+        """
+        # L1: exact repeats skip the embedding call entirely
+        key = self._exact_key(query, session_id)
+        hit = self._exact.get(key)
+        if hit is not None:
+            response, stored_at = hit
+            if time.monotonic() - stored_at < self.ttl:
+                self._exact.move_to_end(key)
+                return response
+            del self._exact[key]
+
+        if self._size == 0:
+            return None
+
+        try:
+            embedding = self._embed(query)
+        except Exception as e:
+            print(f"Warning: Semantic cache lookup failed: {e}")
+            return None
+
+        # Normalized vectors make cosine a single matrix-vector product
+        sims = self._vectors[: self._size] @ embedding
+
+        cutoff = time.monotonic() - self.ttl
+        for idx in np.argsort(-sims):
+            if sims[idx] < self.threshold:
+                break
+            if self._stored_at[idx] < cutoff:
+                continue
+            if session_id and self._sessions[idx] != session_id:
+                continue
+            return self._responses[idx]
+        return None
+
+    def put(self, query: str, response: str, session_id: Optional[str] = None):
+        """Store a query/response pair for future lookups."""
+        self._exact[self._exact_key(query, session_id)] = (
+            response,
+            time.monotonic(),
+        )
+        while len(self._exact) > self.max_entries:
+            self._exact.popitem(last=False)
+
+        try:
+            embedding = self._embed(query)
+        except Exception as e:
+            print(f"Warning: Semantic cache store failed: {e}")
+            return
+
+        if self._vectors is None:
+            self._vectors = np.zeros(
+                (self.max_entries, embedding.shape[0]), dtype=np.float16
+            )
+
+        # Ring buffer: overwrite the oldest slot once full
+        self._vectors[self._next] = embedding
+        self._responses[self._next] = response
+        self._sessions[self._next] = session_id
+        self._stored_at[self._next] = time.monotonic()
+        self._next = (self._next + 1) % self.max_entries
+        self._size = min(self._size + 1, self.max_entries)
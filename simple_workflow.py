@@ -3,15 +3,110 @@ Jarvis Simple Workflow
 Single-agent mode with memory integration.
 """
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 from uuid import uuid4
 
-from google import genai
 from google.genai import types
 
+from clients import get_genai_client
 from config import Config
 from prompts import JARVIS_SIMPLE_PROMPT
-from memory import MemoryManager
+from memory import MemoryManager, acquire_shared_memory, release_shared_memory
+
+try:
+    import ahocorasick
+except ImportError:  # Optional - fall back to per-keyword substring scans
+    ahocorasick = None
+
+
+# Keyword tables for pattern detection, hoisted to module scope
+_TOPIC_KEYWORDS = {
+    "terraform": ["terraform", "tf", "infrastructure", "iac"],
+    "python": ["python", "py", "pip", "venv"],
+    "docker": ["docker", "container", "dockerfile"],
+    "kubernetes": ["kubernetes", "k8s", "kubectl", "helm"],
+    "aws": ["aws", "s3", "ec2", "lambda", "cloudformation"],
+    "git": ["git", "github", "commit", "branch", "merge"],
+    "debugging": ["debug", "error", "fix", "issue", "bug"],
+    "architecture": ["architecture", "design", "pattern", "structure"],
+}
+
+_TASK_KEYWORDS = {
+    "creation": ["create", "write", "generate", "make"],
+    "debugging": ["fix", "debug", "error", "issue"],
+    "explanation": ["explain", "what is", "how does"],
+    "review": ["review", "check", "validate"],
+}
+
+# Mirrors the original if/elif chain: only the highest-priority task
+# type that matched gets tracked
+_TASK_PRIORITY = ("creation", "debugging", "explanation", "review")
+
+
+# Each (pattern_type, pattern_data) pair owns one bit; a keyword maps to
+# the OR of its pairs' bits. Match bookkeeping during a scan is then a
+# single integer OR per hit - no set hashing or tuple allocation.
+_BIT_META: list[tuple[str, str]] = []
+_KEYWORD_MASKS: dict[str, int] = {}
+
+
+def _build_keyword_tables():
+    """Assign bit indices and build the keyword -> bitmask table."""
+    pair_bit: dict[tuple[str, str], int] = {}
+
+    def bit_for(pair: tuple[str, str]) -> int:
+        bit = pair_bit.get(pair)
+        if bit is None:
+            bit = len(_BIT_META)
+            pair_bit[pair] = bit
+            _BIT_META.append(pair)
+        return bit
+
+    for topic, keywords in _TOPIC_KEYWORDS.items():
+        for kw in keywords:
+            _KEYWORD_MASKS[kw] = _KEYWORD_MASKS.get(kw, 0) | (
+                1 << bit_for(("topic", topic))
+            )
+    for task, keywords in _TASK_KEYWORDS.items():
+        for kw in keywords:
+            _KEYWORD_MASKS[kw] = _KEYWORD_MASKS.get(kw, 0) | (
+                1 << bit_for(("task_type", task))
+            )
+
+    topic_mask = sum(
+        1 << i for i, (ptype, _) in enumerate(_BIT_META) if ptype == "topic"
+    )
+    task_masks = {
+        pdata: 1 << i
+        for i, (ptype, pdata) in enumerate(_BIT_META)
+        if ptype == "task_type"
+    }
+    return topic_mask, task_masks
+
+
+_TOPIC_MASK, _TASK_MASKS = _build_keyword_tables()
+
+
+def _build_automaton():
+    """Compile all keywords into one Aho-Corasick automaton.
+
+    One linear pass over the message then finds every keyword at once,
+    instead of a substring scan per keyword per topic. Each word's value
+    is its precomputed bitmask.
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for kw, mask in _KEYWORD_MASKS.items():
+        automaton.add_word(kw, mask)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_automaton()
 
 
 class SimpleJarvis:
@@ -19,15 +114,34 @@ class SimpleJarvis:
     Simple single-agent Jarvis with persistent memory.
     """
 
-    def __init__(self, session_id: Optional[str] = None):
-        self.client = genai.Client(api_key=Config.GOOGLE_API_KEY)
+    def __init__(
+        self,
+        session_id: Optional[str] = None,
+        memory: Optional[MemoryManager] = None,
+    ):
+        self.client = get_genai_client()
         self.model = Config.GEMINI_MODEL
         self.session_id = session_id or str(uuid4())
-        self.history: list[types.Content] = []
+        # Bounded deque: eviction is O(1) instead of a slice+copy per turn
+        self.history: deque[types.Content] = deque(maxlen=20)
         self.system_instruction = JARVIS_SIMPLE_PROMPT
 
-        # Initialize memory
-        self.memory = MemoryManager()
+        # Last (system_prompt, config) pair: consecutive turns usually
+        # build the identical prompt, so the config object is reused
+        self._config_cache: Optional[tuple[str, types.GenerateContentConfig]] = None
+
+        # Memory: the process-wide shared manager unless one is injected
+        self._memory_shared = memory is None
+        self.memory = acquire_shared_memory() if memory is None else memory
+
+        # Recall prefetched in the background while the model streams;
+        # (query, future) pair consumed by _get_relevant_context
+        self._prefetch = ThreadPoolExecutor(max_workers=2)
+        self._recall_cache: Optional[tuple[str, Future]] = None
+
+        # Conversation writes happen off the critical path; one worker
+        # keeps them ordered
+        self._writer = ThreadPoolExecutor(max_workers=1)
 
         # Load recent history from memory if resuming session
         self._load_session_history()
@@ -36,57 +150,72 @@ class SimpleJarvis:
         """Load conversation history from memory for this session."""
         recent = self.memory.get_recent_history(self.session_id, limit=10)
 
-        for msg in recent:
-            role = "user" if msg["role"] == "user" else "model"
-            self.history.append(
-                types.Content(role=role, parts=[types.Part(text=msg["content"])])
+        self.history.extend(
+            types.Content(
+                role="user" if msg["role"] == "user" else "model",
+                parts=[types.Part(text=msg["content"])],
             )
+            for msg in recent
+        )
 
     def _get_relevant_context(self, query: str) -> str:
         """Retrieve relevant memories for the current query."""
-        memories = self.memory.recall(query, n_results=3)
-
-        if not memories:
+        cached = self._recall_cache
+        if cached is not None and cached[0] == query:
+            self._recall_cache = None
+            try:
+                contents, _, relevances = cached[1].result()
+            except Exception:
+                contents, _, relevances = self.memory.recall(query, n_results=3)
+        else:
+            contents, _, relevances = self.memory.recall(query, n_results=3)
+
+        if not contents:
             return ""
 
         context_parts = ["[Relevant memories from past conversations:]"]
-        for mem in memories:
-            if mem["relevance"] > 0.5:  # Only include if reasonably relevant
-                context_parts.append(f"- {mem['content'][:300]}...")
+        for content, relevance in zip(contents, relevances):
+            if relevance > 0.5:  # Only include if reasonably relevant
+                context_parts.append(f"- {content[:300]}...")
 
         if len(context_parts) > 1:
             return "\n".join(context_parts) + "\n\n"
         return ""
 
     def _detect_patterns(self, message: str):
-        """Detect and track patterns in user messages."""
-        message_lower = message.lower()
+        """Detect and track patterns in user messages.
 
-        # Track topic patterns
-        topics = {
-            "terraform": ["terraform", "tf", "infrastructure", "iac"],
-            "python": ["python", "py", "pip", "venv"],
-            "docker": ["docker", "container", "dockerfile"],
-            "kubernetes": ["kubernetes", "k8s", "kubectl", "helm"],
-            "aws": ["aws", "s3", "ec2", "lambda", "cloudformation"],
-            "git": ["git", "github", "commit", "branch", "merge"],
-            "debugging": ["debug", "error", "fix", "issue", "bug"],
-            "architecture": ["architecture", "design", "pattern", "structure"],
-        }
-
-        for topic, keywords in topics.items():
-            if any(kw in message_lower for kw in keywords):
-                self.memory.track_pattern("topic", topic)
-
-        # Track task type patterns
-        if any(kw in message_lower for kw in ["create", "write", "generate", "make"]):
-            self.memory.track_pattern("task_type", "creation")
-        elif any(kw in message_lower for kw in ["fix", "debug", "error", "issue"]):
-            self.memory.track_pattern("task_type", "debugging")
-        elif any(kw in message_lower for kw in ["explain", "what is", "how does"]):
-            self.memory.track_pattern("task_type", "explanation")
-        elif any(kw in message_lower for kw in ["review", "check", "validate"]):
-            self.memory.track_pattern("task_type", "review")
+        Matches are deduplicated before hitting the database, so a
+        message mentioning a keyword five times still costs one write.
+        """
+        message_lower = message.lower()
+        mask = 0
+
+        if _KEYWORD_AUTOMATON is not None:
+            # Single linear pass; one integer OR per keyword occurrence
+            for _, kw_mask in _KEYWORD_AUTOMATON.iter(message_lower):
+                mask |= kw_mask
+        else:
+            for kw, kw_mask in _KEYWORD_MASKS.items():
+                if kw in message_lower:
+                    mask |= kw_mask
+
+        # Walk only the set topic bits, then flush everything in one
+        # transaction instead of a write per matched pattern
+        hits: list[tuple[str, str]] = []
+        topic_mask = mask & _TOPIC_MASK
+        while topic_mask:
+            bit = topic_mask & -topic_mask
+            _, topic = _BIT_META[bit.bit_length() - 1]
+            hits.append(("topic", topic))
+            topic_mask ^= bit
+
+        for task in _TASK_PRIORITY:
+            if mask & _TASK_MASKS[task]:
+                hits.append(("task_type", task))
+                break
+
+        self.memory.track_patterns(hits)
 
     def _build_system_prompt(self, query: str) -> str:
         """Build system prompt with memory context."""
@@ -111,6 +240,19 @@ class SimpleJarvis:
             return f"{base}\n\n{memory_context}"
         return base
 
+    def _gen_config(self, system_prompt: str) -> types.GenerateContentConfig:
+        """Build (or reuse) the generation config for a system prompt."""
+        cached = self._config_cache
+        if cached is not None and cached[0] == system_prompt:
+            return cached[1]
+
+        config = types.GenerateContentConfig(
+            system_instruction=system_prompt,
+            max_output_tokens=4096,
+        )
+        self._config_cache = (system_prompt, config)
+        return config
+
     def chat(self, message: str) -> str:
         """Send a message and get a response with memory."""
         # Detect patterns
@@ -127,11 +269,8 @@ class SimpleJarvis:
         # Call model
         response = self.client.models.generate_content(
             model=self.model,
-            contents=self.history,
-            config=types.GenerateContentConfig(
-                system_instruction=system_prompt,
-                max_output_tokens=4096,
-            ),
+            contents=list(self.history),
+            config=self._gen_config(system_prompt),
         )
 
         response_text = response.text
@@ -141,21 +280,29 @@ class SimpleJarvis:
             types.Content(role="model", parts=[types.Part(text=response_text)])
         )
 
-        # Store in persistent memory
-        self.memory.store(
+        # Store in persistent memory (off-thread; see close())
+        self._writer.submit(
+            self.memory.store,
             session_id=self.session_id,
             user_message=message,
             assistant_response=response_text,
         )
 
-        # Keep session history manageable
-        if len(self.history) > 20:
-            self.history = self.history[-20:]
-
         return response_text
 
-    def stream(self, message: str):
-        """Stream a response with memory."""
+    def stream(
+        self,
+        message: str,
+        min_batch: int = 1,
+        max_batch: int = 50,
+        growth: int = 3,
+    ):
+        """Stream a response with memory.
+
+        SDK chunks are coalesced into batches that grow geometrically
+        from min_batch to max_batch, so time-to-first-token stays low
+        while long responses pay far fewer per-chunk yields.
+        """
         # Detect patterns
         self._detect_patterns(message)
 
@@ -167,48 +314,103 @@ class SimpleJarvis:
         # Build context-aware system prompt
         system_prompt = self._build_system_prompt(message)
 
-        # Stream response
-        full_response = ""
+        # Stream response; collected parts are joined once at the end
+        # instead of growing a string per batch
+        parts: list[str] = []
+        buf: list[str] = []
+        batch_target = min_batch
 
         for chunk in self.client.models.generate_content_stream(
             model=self.model,
-            contents=self.history,
-            config=types.GenerateContentConfig(
-                system_instruction=system_prompt,
-                max_output_tokens=4096,
-            ),
+            contents=list(self.history),
+            config=self._gen_config(system_prompt),
         ):
             if chunk.text:
-                full_response += chunk.text
-                yield chunk.text
+                buf.append(chunk.text)
+                if len(buf) >= batch_target:
+                    piece = "".join(buf)
+                    buf.clear()
+                    batch_target = min(max_batch, batch_target * growth)
+                    parts.append(piece)
+                    yield piece
+
+        if buf:
+            piece = "".join(buf)
+            parts.append(piece)
+            yield piece
+
+        full_response = "".join(parts)
+
+        # Prefetch while the user reads/types: re-run recall for this
+        # message so a follow-up or retry resolves from the cache for
+        # free, and the query embedding lands in the LRU warm
+        self._recall_cache = (
+            message,
+            self._prefetch.submit(self.memory.recall, message, 3),
+        )
 
         # Add complete response to history
         self.history.append(
             types.Content(role="model", parts=[types.Part(text=full_response)])
         )
 
-        # Store in persistent memory
-        self.memory.store(
+        # Store in persistent memory (off-thread; see close())
+        self._writer.submit(
+            self.memory.store,
             session_id=self.session_id,
             user_message=message,
             assistant_response=full_response,
         )
 
-        if len(self.history) > 20:
-            self.history = self.history[-20:]
+    def record_exchange(self, message: str, response: str):
+        """Record an exchange that bypassed the model (e.g. a cache hit).
+
+        Keeps session history and persistent memory consistent with what
+        the user actually saw, so follow-up turns can refer back to it.
+        """
+        self.history.append(
+            types.Content(role="user", parts=[types.Part(text=message)])
+        )
+        self.history.append(
+            types.Content(role="model", parts=[types.Part(text=response)])
+        )
+        self._writer.submit(
+            self.memory.store,
+            session_id=self.session_id,
+            user_message=message,
+            assistant_response=response,
+        )
+
+    def warmup(self):
+        """Pre-warm memory and embedding paths before the first message.
+
+        Meant to run from a background thread/task so the user's typing
+        time absorbs the cold-start cost (SQLite page cache, vector index
+        load, first embedding round-trip). Best-effort: failures here
+        just mean the first real message pays the cost instead.
+        """
+        try:
+            self.memory.get_stats()
+            self.memory.recall("warmup", n_results=1)
+        except Exception:
+            pass
 
     def clear_history(self):
         """Clear session history (memory persists)."""
-        self.history = []
+        self.history.clear()
 
     def get_memory_stats(self) -> dict:
         """Get memory statistics."""
         return self.memory.get_stats()
 
-    def get_patterns(self) -> list[dict]:
+    def get_patterns(self, limit: Optional[int] = None) -> list[dict]:
         """Get detected patterns."""
-        return self.memory.get_patterns()
+        return self.memory.get_patterns(limit=limit)
 
     def close(self):
         """Clean up resources."""
-        self.memory.close()
+        self._prefetch.shutdown(wait=False)
+        # Drain pending conversation writes before releasing memory
+        self._writer.shutdown(wait=True)
+        if self._memory_shared:
+            release_shared_memory()
@@ -1,21 +1,32 @@
 #!/usr/bin/env python3
 """Test Gemini API directly using new google-genai package."""
+import argparse
 import os
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
 from google import genai
 
+parser = argparse.ArgumentParser(description="Smoke-test the Gemini API.")
+parser.add_argument(
+    "--list-models",
+    action="store_true",
+    help="Also list available models (extra API round-trip)",
+)
+args = parser.parse_args()
+
 api_key = os.getenv("GOOGLE_API_KEY")
 print(f"API Key (first 10 chars): {api_key[:10]}...")
 
 client = genai.Client(api_key=api_key)
 
-# List available models
-print("\nAvailable models:")
-for model in client.models.list():
-    print(f"  - {model.name}")
+# List available models (opt-in: it's a whole extra round-trip)
+if args.list_models:
+    print("\nAvailable models:")
+    for model in client.models.list():
+        print(f"  - {model.name}")
 
 # Test with gemini-2.5-flash
 print("\nTesting gemini-2.5-flash...")
@@ -4,16 +4,21 @@ Custom supervisor pattern using google-genai SDK directly.
 No deprecated LangChain dependencies.
 """
 
-import json
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Generator
+from typing import Callable, Optional, Generator
+
+import numpy as np
 
 from google import genai
 from google.genai import types
 
+from clients import get_genai_client
 from config import Config
-from memory import MemoryManager
+from memory import MemoryManager, acquire_shared_memory, release_shared_memory
 from prompts import (
     JARVIS_SUPERVISOR_PROMPT,
     PROMPT_REFINER_PROMPT,
@@ -24,6 +29,19 @@ from prompts import (
 )
 
 
+def _truncate(text: str, head: int = 2000, tail: int = 1500) -> str:
+    """Bound text fed into a downstream LLM call.
+
+    Keeps the first `head` and last `tail` characters with a marker in
+    between, so prompt size (and token cost) stays fixed no matter how
+    verbose the upstream agent was. The small slack avoids truncating
+    text that barely exceeds the cap.
+    """
+    if len(text) <= head + tail + 50:
+        return text
+    return f"{text[:head]}\n...[truncated]...\n{text[-tail:]}"
+
+
 class AgentType(Enum):
     """Available agent types."""
 
@@ -72,52 +90,166 @@ class Agent:
         self.client = client
         self.model = model
 
-    def invoke(self, message: str, context: Optional[str] = None) -> str:
-        """Invoke the agent with a message."""
-        full_prompt = self.system_prompt
-        if context:
-            full_prompt = (
+        # Context-free calls reuse one config object instead of paying a
+        # Pydantic construction per request
+        self._base_config = types.GenerateContentConfig(
+            system_instruction=system_prompt,
+            max_output_tokens=4096,
+        )
+
+        # Last (context, config) pair: workflow steps often pass the
+        # same context string repeatedly, so the prefixed prompt and
+        # its config are built once and reused
+        self._ctx_config: Optional[tuple[str, types.GenerateContentConfig]] = None
+
+    def _config(self, context: Optional[str]) -> types.GenerateContentConfig:
+        """Config for a call: the cached one, or one built for context."""
+        if not context:
+            return self._base_config
+
+        cached = self._ctx_config
+        if cached is not None and cached[0] == context:
+            return cached[1]
+
+        config = types.GenerateContentConfig(
+            system_instruction=(
                 f"{self.system_prompt}\n\n[Context from previous steps:]\n{context}"
-            )
+            ),
+            max_output_tokens=4096,
+        )
+        self._ctx_config = (context, config)
+        return config
 
+    def invoke(self, message: str, context: Optional[str] = None) -> str:
+        """Invoke the agent with a message."""
         response = self.client.models.generate_content(
             model=self.model,
             contents=[types.Content(role="user", parts=[types.Part(text=message)])],
-            config=types.GenerateContentConfig(
-                system_instruction=full_prompt,
-                max_output_tokens=4096,
-            ),
+            config=self._config(context),
+        )
+        return response.text
+
+    async def ainvoke(self, message: str, context: Optional[str] = None) -> str:
+        """Invoke the agent asynchronously (for concurrent agent calls)."""
+        response = await self.client.aio.models.generate_content(
+            model=self.model,
+            contents=[types.Content(role="user", parts=[types.Part(text=message)])],
+            config=self._config(context),
         )
         return response.text
 
     def stream(
-        self, message: str, context: Optional[str] = None
+        self,
+        message: str,
+        context: Optional[str] = None,
+        min_batch: int = 1,
+        max_batch: int = 50,
+        growth: int = 3,
     ) -> Generator[str, None, None]:
-        """Stream response from the agent."""
-        full_prompt = self.system_prompt
-        if context:
-            full_prompt = (
-                f"{self.system_prompt}\n\n[Context from previous steps:]\n{context}"
-            )
+        """Stream response from the agent.
+
+        SDK chunks are coalesced into batches that grow geometrically
+        from min_batch to max_batch: the first token still goes out
+        immediately, but steady-state throughput pays one yield per
+        batch instead of one per chunk.
+        """
+        buf: list[str] = []
+        batch_target = min_batch
 
         for chunk in self.client.models.generate_content_stream(
             model=self.model,
             contents=[types.Content(role="user", parts=[types.Part(text=message)])],
-            config=types.GenerateContentConfig(
-                system_instruction=full_prompt,
-                max_output_tokens=4096,
-            ),
+            config=self._config(context),
         ):
             if chunk.text:
-                yield chunk.text
+                buf.append(chunk.text)
+                if len(buf) >= batch_target:
+                    yield "".join(buf)
+                    buf.clear()
+                    batch_target = min(max_batch, batch_target * growth)
+
+        if buf:
+            yield "".join(buf)
+
+
+# Sentinel distinguishing "not cached" from a cached None route
+_ROUTE_MISS = object()
 
 
 class Supervisor(Agent):
     """
     Supervisor agent that routes to specialized agents.
     Uses function calling to decide which agent to invoke.
+
+    Routing decisions are cached in two tiers - exact match on the
+    lowered query, then cosine similarity against previously routed
+    queries - since the output space is only four labels and repeat or
+    paraphrased queries are common.
     """
 
+    ROUTE_CACHE_SIZE = 512
+    ROUTE_SIMILARITY = 0.9
+
+    def __init__(
+        self,
+        agent_type: AgentType,
+        system_prompt: str,
+        client: genai.Client,
+        model: str,
+        embed_fn: Optional[Callable[[str], list[float]]] = None,
+    ):
+        super().__init__(agent_type, system_prompt, client, model)
+        self.embed_fn = embed_fn
+
+        self._route_exact: OrderedDict = OrderedDict()
+        # Semantic tier: ring buffer of unit query vectors + labels
+        self._route_vecs: Optional[np.ndarray] = None
+        self._route_labels: list = [None] * self.ROUTE_CACHE_SIZE
+        self._route_size = 0
+        self._route_next = 0
+
+    def _route_lookup(self, query: str):
+        """Return a cached route, or _ROUTE_MISS."""
+        key = query.strip().lower()
+        if key in self._route_exact:
+            self._route_exact.move_to_end(key)
+            return self._route_exact[key]
+
+        if self.embed_fn is not None and self._route_size:
+            try:
+                q = np.asarray(self.embed_fn(query), dtype=np.float32)
+            except Exception:
+                return _ROUTE_MISS
+            # Vectors are unit-normalized, so dot product = cosine
+            sims = self._route_vecs[: self._route_size] @ q
+            best = int(np.argmax(sims))
+            if sims[best] >= self.ROUTE_SIMILARITY:
+                return self._route_labels[best]
+
+        return _ROUTE_MISS
+
+    def _route_store(self, query: str, label: Optional[AgentType]):
+        """Insert a fresh routing decision into both cache tiers."""
+        key = query.strip().lower()
+        self._route_exact[key] = label
+        while len(self._route_exact) > self.ROUTE_CACHE_SIZE:
+            self._route_exact.popitem(last=False)
+
+        if self.embed_fn is None:
+            return
+        try:
+            q = np.asarray(self.embed_fn(query), dtype=np.float32)
+        except Exception:
+            return
+        if self._route_vecs is None:
+            self._route_vecs = np.zeros(
+                (self.ROUTE_CACHE_SIZE, q.shape[0]), dtype=np.float32
+            )
+        self._route_vecs[self._route_next] = q
+        self._route_labels[self._route_next] = label
+        self._route_next = (self._route_next + 1) % self.ROUTE_CACHE_SIZE
+        self._route_size = min(self._route_size + 1, self.ROUTE_CACHE_SIZE)
+
     ROUTING_PROMPT = """You are the JARVIS supervisor. Analyze the user's request and decide which specialist agent should handle it.
 
 Available agents:
@@ -136,40 +268,78 @@ Examples:
 - "What time is it?" -> {"agent": "none", "reason": "General question"}
 """
 
+    # One shared config for every routing call
+    ROUTING_CONFIG = types.GenerateContentConfig(
+        system_instruction=ROUTING_PROMPT,
+        max_output_tokens=256,
+    )
+
     def route(self, query: str) -> Optional[AgentType]:
         """Determine which agent should handle the query."""
+        cached = self._route_lookup(query)
+        if cached is not _ROUTE_MISS:
+            return cached
+
         response = self.client.models.generate_content(
             model=self.model,
             contents=[types.Content(role="user", parts=[types.Part(text=query)])],
-            config=types.GenerateContentConfig(
-                system_instruction=self.ROUTING_PROMPT,
-                max_output_tokens=256,
-            ),
+            config=self.ROUTING_CONFIG,
         )
+        label = self._parse_route(response)
+        self._route_store(query, label)
+        return label
 
-        try:
-            # Parse JSON response
-            text = response.text.strip()
-            # Handle markdown code blocks
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
+    async def aroute(self, query: str) -> Optional[AgentType]:
+        """Async variant of route, for overlapping with other startup work."""
+        cached = await asyncio.to_thread(self._route_lookup, query)
+        if cached is not _ROUTE_MISS:
+            return cached
 
-            result = json.loads(text)
-            agent_name = result.get("agent", "none")
+        response = await self.client.aio.models.generate_content(
+            model=self.model,
+            contents=[types.Content(role="user", parts=[types.Part(text=query)])],
+            config=self.ROUTING_CONFIG,
+        )
+        label = self._parse_route(response)
+        await asyncio.to_thread(self._route_store, query, label)
+        return label
+
+    # Quoted label -> route, scanned in the "agent" value first so the
+    # free-text reason field can't hijack the decision
+    _ROUTE_LABELS: tuple[tuple[str, Optional[AgentType]], ...] = (
+        ("backend", AgentType.BACKEND),
+        ("frontend", AgentType.FRONTEND),
+        ("devops", AgentType.DEVOPS),
+        ("none", None),
+    )
+
+    def _parse_route(self, response) -> Optional[AgentType]:
+        """Parse the routing response into an AgentType.
+
+        The output space is four labels, so a substring scan replaces
+        JSON parsing and its markdown-fence stripping - malformed or
+        fenced responses resolve the same as clean ones. The scan keys
+        on '"agent": "<label>"' when present; the reason field is free
+        text and may mention any label (e.g. "not a backend task"), so
+        a bare priority scan over the whole response would misroute.
+        Without that anchor, the earliest label occurrence wins.
+        """
+        text = (response.text or "").lower()
 
-            agent_map = {
-                "backend_agent": AgentType.BACKEND,
-                "frontend_agent": AgentType.FRONTEND,
-                "devops_agent": AgentType.DEVOPS,
-            }
+        for label, route in self._ROUTE_LABELS:
+            if f'"agent": "{label}' in text or f'"agent":"{label}' in text:
+                return route
 
-            return agent_map.get(agent_name)
+        best: Optional[tuple[int, Optional[AgentType]]] = None
+        for label, route in self._ROUTE_LABELS:
+            pos = text.find(label)
+            if pos != -1 and (best is None or pos < best[0]):
+                best = (pos, route)
+        if best is not None:
+            return best[1]
 
-        except (json.JSONDecodeError, KeyError):
-            # Default to devops for ambiguous cases (given user's background)
-            return AgentType.DEVOPS
+        # Default to devops for ambiguous cases (given user's background)
+        return AgentType.DEVOPS
 
 
 class MultiAgentWorkflow:
@@ -178,77 +348,94 @@ class MultiAgentWorkflow:
     User -> Prompt Refiner -> Specialist -> PR Reviewer -> User
     """
 
-    def __init__(self, session_id: Optional[str] = None):
-        self.client = genai.Client(api_key=Config.GOOGLE_API_KEY)
+    def __init__(
+        self,
+        session_id: Optional[str] = None,
+        memory: Optional[MemoryManager] = None,
+    ):
+        self.client = get_genai_client()
         self.model = Config.GEMINI_MODEL
         self.session_id = session_id or "default"
 
-        # Initialize memory
-        self.memory = MemoryManager()
+        # Memory: the process-wide shared manager unless one is injected
+        self._memory_shared = memory is None
+        self.memory = acquire_shared_memory() if memory is None else memory
+
+        # Overlaps the routing call with the memory-context lookup in the
+        # sync entry points; arun() uses asyncio.gather for the same thing
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+        # Conversation writes happen off the critical path; one worker
+        # keeps them ordered per session
+        self._writer = ThreadPoolExecutor(max_workers=1)
 
         # Initialize agents
         self._init_agents()
 
     def _init_agents(self):
-        """Initialize all agents."""
+        """Initialize the supervisor; specialists are built on demand."""
         self.supervisor = Supervisor(
             agent_type=AgentType.SUPERVISOR,
             system_prompt=JARVIS_SUPERVISOR_PROMPT,
             client=self.client,
             model=self.model,
+            embed_fn=self.memory._get_embedding,
         )
 
-        self.agents = {
-            AgentType.PROMPT_REFINER: Agent(
-                agent_type=AgentType.PROMPT_REFINER,
-                system_prompt=PROMPT_REFINER_PROMPT,
-                client=self.client,
-                model=self.model,
-            ),
-            AgentType.BACKEND: Agent(
-                agent_type=AgentType.BACKEND,
-                system_prompt=BACKEND_AGENT_PROMPT,
-                client=self.client,
-                model=self.model,
-            ),
-            AgentType.FRONTEND: Agent(
-                agent_type=AgentType.FRONTEND,
-                system_prompt=FRONTEND_AGENT_PROMPT,
-                client=self.client,
-                model=self.model,
-            ),
-            AgentType.DEVOPS: Agent(
-                agent_type=AgentType.DEVOPS,
-                system_prompt=DEVOPS_AGENT_PROMPT,
-                client=self.client,
-                model=self.model,
-            ),
-            AgentType.PR_REVIEWER: Agent(
-                agent_type=AgentType.PR_REVIEWER,
-                system_prompt=PR_REVIEWER_PROMPT,
+        # A single run touches at most three of these five; construct
+        # each Agent the first time it is actually routed to
+        self._agent_prompts = {
+            AgentType.PROMPT_REFINER: PROMPT_REFINER_PROMPT,
+            AgentType.BACKEND: BACKEND_AGENT_PROMPT,
+            AgentType.FRONTEND: FRONTEND_AGENT_PROMPT,
+            AgentType.DEVOPS: DEVOPS_AGENT_PROMPT,
+            AgentType.PR_REVIEWER: PR_REVIEWER_PROMPT,
+        }
+        self._agent_cache: dict[AgentType, Agent] = {}
+
+    def _agent(self, agent_type: AgentType) -> Agent:
+        """Get (lazily creating) the agent for a type."""
+        agent = self._agent_cache.get(agent_type)
+        if agent is None:
+            agent = Agent(
+                agent_type=agent_type,
+                system_prompt=self._agent_prompts[agent_type],
                 client=self.client,
                 model=self.model,
-            ),
-        }
+            )
+            self._agent_cache[agent_type] = agent
+        return agent
 
     def _get_memory_context(self, query: str) -> str:
         """Retrieve relevant memory context."""
-        memories = self.memory.recall(query, n_results=3)
+        contents, _, relevances = self.memory.recall(query, n_results=3)
 
-        if not memories:
+        if not contents:
             return ""
 
         context_parts = []
-        for mem in memories:
-            if mem["relevance"] > 0.5:
-                context_parts.append(f"- {mem['content'][:300]}")
+        for content, relevance in zip(contents, relevances):
+            if relevance > 0.5:
+                context_parts.append(f"- {content[:300]}")
 
         if context_parts:
-            return "[Relevant past context:]\n" + "\n".join(context_parts)
+            return _truncate("[Relevant past context:]\n" + "\n".join(context_parts))
         return ""
 
+    @staticmethod
+    def _worth_reviewing(specialist_response: str) -> bool:
+        """Whether a specialist response justifies review + summary calls.
+
+        Anything short and code-free is already a complete answer;
+        reviewing it or summarizing it just burns two LLM round-trips.
+        """
+        return (
+            len(specialist_response) >= Config.REVIEW_MIN_RESPONSE_CHARS
+            or "```" in specialist_response
+        )
+
     def run(
-        self, query: str, skip_review: bool = False
+        self, query: str, skip_review: bool = False, stream_specialist: bool = True
     ) -> Generator[AgentResponse, None, None]:
         """
         Run the full workflow, yielding responses from each agent.
@@ -256,15 +443,20 @@ class MultiAgentWorkflow:
         Args:
             query: User's input
             skip_review: Skip PR review step (faster, fewer API calls)
+            stream_specialist: Yield the specialist's output incrementally
+                as delta chunks (metadata {"delta": True}) so the first
+                tokens arrive within one network round-trip
 
         Yields:
             AgentResponse for each step
         """
         state = WorkflowState(original_query=query)
-        memory_context = self._get_memory_context(query)
 
-        # Step 1: Route to determine specialist
-        target_agent = self.supervisor.route(query)
+        # Step 1: Route and recall concurrently - they are independent,
+        # so the slower of the two bounds startup instead of their sum
+        route_future = self._executor.submit(self.supervisor.route, query)
+        memory_context = self._get_memory_context(query)
+        target_agent = route_future.result()
 
         if target_agent is None:
             # No specialist needed - supervisor handles directly
@@ -278,7 +470,7 @@ class MultiAgentWorkflow:
             )
 
             # Store in memory
-            self.memory.store(self.session_id, query, response)
+            self._writer.submit(self.memory.store, self.session_id, query, response)
             return
 
         # Step 2: Refine the prompt
@@ -288,7 +480,7 @@ class MultiAgentWorkflow:
             metadata={"status": "starting"},
         )
 
-        refiner = self.agents[AgentType.PROMPT_REFINER]
+        refiner = self._agent(AgentType.PROMPT_REFINER)
         refined = refiner.invoke(
             query, context=memory_context if memory_context else None
         )
@@ -307,8 +499,148 @@ class MultiAgentWorkflow:
             metadata={"status": "starting"},
         )
 
-        specialist = self.agents[target_agent]
-        specialist_response = specialist.invoke(
+        specialist = self._agent(target_agent)
+        if stream_specialist:
+            parts: list[str] = []
+            for chunk in specialist.stream(
+                refined, context=f"Original request: {query}"
+            ):
+                parts.append(chunk)
+                yield AgentResponse(
+                    agent=target_agent,
+                    content=chunk,
+                    metadata={"delta": True},
+                )
+            specialist_response = "".join(parts)
+            state.specialist_response = specialist_response
+            state.agents_called.append(target_agent)
+            yield AgentResponse(
+                agent=target_agent,
+                content="",
+                metadata={"status": "complete"},
+            )
+        else:
+            specialist_response = specialist.invoke(
+                refined,
+                context=f"Original request: {query}",
+            )
+            state.specialist_response = specialist_response
+            state.agents_called.append(target_agent)
+
+            yield AgentResponse(
+                agent=target_agent,
+                content=specialist_response,
+            )
+
+        # A short answer with no code gains nothing from a review pass
+        # or a summary of itself - return it directly and save two calls
+        if not self._worth_reviewing(specialist_response):
+            state.final_response = specialist_response
+            full_response = f"[Agents: {', '.join(a.value for a in state.agents_called)}]\n\n{specialist_response}"
+            self._writer.submit(self.memory.store, self.session_id, query, full_response)
+            return
+
+        # Step 4: PR Review (optional)
+        if not skip_review:
+            yield AgentResponse(
+                agent=AgentType.PR_REVIEWER,
+                content="",
+                metadata={"status": "starting"},
+            )
+
+            reviewer = self._agent(AgentType.PR_REVIEWER)
+            review = reviewer.invoke(
+                f"Review this response:\n\n{_truncate(specialist_response)}",
+                context=f"Original request: {query}\nRefined request: {refined}",
+            )
+            state.review_result = review
+            state.agents_called.append(AgentType.PR_REVIEWER)
+
+            yield AgentResponse(
+                agent=AgentType.PR_REVIEWER,
+                content=review,
+            )
+
+        # Step 5: Final summary from supervisor
+        final_prompt = f"""Summarize the results for the user in your Jarvis style.
+
+Original request: {query}
+Specialist ({target_agent.value}) response: {_truncate(specialist_response, head=700, tail=300)}
+{"Review: " + _truncate(state.review_result, head=350, tail=150) if state.review_result else ""}
+
+Provide a brief, elegant summary. Don't repeat the full code - just confirm what was done and any key points."""
+
+        final_response = self.supervisor.invoke(final_prompt)
+        state.final_response = final_response
+
+        yield AgentResponse(
+            agent=AgentType.SUPERVISOR,
+            content=final_response,
+        )
+
+        # Store in memory
+        full_response = f"[Agents: {', '.join(a.value for a in state.agents_called)}]\n\n{specialist_response}"
+        self._writer.submit(self.memory.store, self.session_id, query, full_response)
+
+    async def arun(self, query: str, skip_review: bool = False):
+        """
+        Async variant of run().
+
+        Independent steps run concurrently with asyncio.gather: routing and
+        the memory-context lookup don't depend on each other, so the slower
+        of the two bounds the startup latency instead of their sum. The
+        refiner -> specialist -> reviewer chain stays sequential because each
+        step consumes the previous one's output.
+
+        Yields:
+            AgentResponse for each step
+        """
+        state = WorkflowState(original_query=query)
+
+        # Routing and memory recall are independent - overlap them.
+        target_agent, memory_context = await asyncio.gather(
+            self.supervisor.aroute(query),
+            asyncio.to_thread(self._get_memory_context, query),
+        )
+
+        if target_agent is None:
+            response = await self.supervisor.ainvoke(
+                query,
+                context=memory_context if memory_context else None,
+            )
+            yield AgentResponse(
+                agent=AgentType.SUPERVISOR,
+                content=response,
+            )
+            self._writer.submit(self.memory.store, self.session_id, query, response)
+            return
+
+        yield AgentResponse(
+            agent=AgentType.PROMPT_REFINER,
+            content="",
+            metadata={"status": "starting"},
+        )
+
+        refiner = self._agent(AgentType.PROMPT_REFINER)
+        refined = await refiner.ainvoke(
+            query, context=memory_context if memory_context else None
+        )
+        state.refined_query = refined
+        state.agents_called.append(AgentType.PROMPT_REFINER)
+
+        yield AgentResponse(
+            agent=AgentType.PROMPT_REFINER,
+            content=refined,
+        )
+
+        yield AgentResponse(
+            agent=target_agent,
+            content="",
+            metadata={"status": "starting"},
+        )
+
+        specialist = self._agent(target_agent)
+        specialist_response = await specialist.ainvoke(
             refined,
             context=f"Original request: {query}",
         )
@@ -320,7 +652,15 @@ class MultiAgentWorkflow:
             content=specialist_response,
         )
 
-        # Step 4: PR Review (optional)
+        # Same short-answer gate as run(): skip review and summary
+        if not self._worth_reviewing(specialist_response):
+            state.final_response = specialist_response
+            full_response = f"[Agents: {', '.join(a.value for a in state.agents_called)}]\n\n{specialist_response}"
+            self._writer.submit(
+                self.memory.store, self.session_id, query, full_response
+            )
+            return
+
         if not skip_review:
             yield AgentResponse(
                 agent=AgentType.PR_REVIEWER,
@@ -328,9 +668,9 @@ class MultiAgentWorkflow:
                 metadata={"status": "starting"},
             )
 
-            reviewer = self.agents[AgentType.PR_REVIEWER]
-            review = reviewer.invoke(
-                f"Review this response:\n\n{specialist_response}",
+            reviewer = self._agent(AgentType.PR_REVIEWER)
+            review = await reviewer.ainvoke(
+                f"Review this response:\n\n{_truncate(specialist_response)}",
                 context=f"Original request: {query}\nRefined request: {refined}",
             )
             state.review_result = review
@@ -341,16 +681,15 @@ class MultiAgentWorkflow:
                 content=review,
             )
 
-        # Step 5: Final summary from supervisor
         final_prompt = f"""Summarize the results for the user in your Jarvis style.
 
 Original request: {query}
-Specialist ({target_agent.value}) response: {specialist_response[:1000]}...
-{"Review: " + state.review_result[:500] if state.review_result else ""}
+Specialist ({target_agent.value}) response: {_truncate(specialist_response, head=700, tail=300)}
+{"Review: " + _truncate(state.review_result, head=350, tail=150) if state.review_result else ""}
 
 Provide a brief, elegant summary. Don't repeat the full code - just confirm what was done and any key points."""
 
-        final_response = self.supervisor.invoke(final_prompt)
+        final_response = await self.supervisor.ainvoke(final_prompt)
         state.final_response = final_response
 
         yield AgentResponse(
@@ -358,9 +697,10 @@ Provide a brief, elegant summary. Don't repeat the full code - just confirm what
             content=final_response,
         )
 
-        # Store in memory
         full_response = f"[Agents: {', '.join(a.value for a in state.agents_called)}]\n\n{specialist_response}"
-        self.memory.store(self.session_id, query, full_response)
+        self._writer.submit(
+            self.memory.store, self.session_id, query, full_response
+        )
 
     def run_fast(self, query: str) -> Generator[AgentResponse, None, None]:
         """
@@ -369,10 +709,10 @@ Provide a brief, elegant summary. Don't repeat the full code - just confirm what
 
         User -> Route -> Specialist -> User
         """
+        # Route and recall concurrently
+        route_future = self._executor.submit(self.supervisor.route, query)
         memory_context = self._get_memory_context(query)
-
-        # Route to determine specialist
-        target_agent = self.supervisor.route(query)
+        target_agent = route_future.result()
 
         if target_agent is None:
             # Supervisor handles directly
@@ -381,7 +721,7 @@ Provide a brief, elegant summary. Don't repeat the full code - just confirm what
                 context=memory_context if memory_context else None,
             )
             yield AgentResponse(agent=AgentType.SUPERVISOR, content=response)
-            self.memory.store(self.session_id, query, response)
+            self._writer.submit(self.memory.store, self.session_id, query, response)
             return
 
         # Call specialist directly
@@ -391,7 +731,7 @@ Provide a brief, elegant summary. Don't repeat the full code - just confirm what
             metadata={"status": "starting"},
         )
 
-        specialist = self.agents[target_agent]
+        specialist = self._agent(target_agent)
         response = specialist.invoke(
             query, context=memory_context if memory_context else None
         )
@@ -399,31 +739,45 @@ Provide a brief, elegant summary. Don't repeat the full code - just confirm what
         yield AgentResponse(agent=target_agent, content=response)
 
         # Store in memory
-        self.memory.store(self.session_id, query, response)
+        self._writer.submit(self.memory.store, self.session_id, query, response)
 
     def stream_fast(self, query: str) -> Generator[tuple[AgentType, str], None, None]:
         """
         Stream the fast workflow response.
         Yields (agent_type, chunk) tuples.
         """
+        # Route and recall concurrently
+        route_future = self._executor.submit(self.supervisor.route, query)
         memory_context = self._get_memory_context(query)
-        target_agent = self.supervisor.route(query)
+        target_agent = route_future.result()
 
         if target_agent is None:
             target_agent = AgentType.SUPERVISOR
             agent = self.supervisor
         else:
-            agent = self.agents[target_agent]
+            agent = self._agent(target_agent)
 
-        full_response = ""
+        parts: list[str] = []
         for chunk in agent.stream(
             query, context=memory_context if memory_context else None
         ):
-            full_response += chunk
+            parts.append(chunk)
             yield (target_agent, chunk)
 
-        # Store in memory
-        self.memory.store(self.session_id, query, full_response)
+        # Store in memory; one join instead of a string grown per chunk
+        self._writer.submit(self.memory.store, self.session_id, query, "".join(parts))
+
+    def warmup(self):
+        """Pre-warm memory and embedding paths before the first request.
+
+        Meant to run from a background thread so typing time absorbs the
+        cold-start cost. Best-effort by design.
+        """
+        try:
+            self.memory.get_stats()
+            self.memory.recall("warmup", n_results=1)
+        except Exception:
+            pass
 
     def get_memory_stats(self) -> dict:
         """Get memory statistics."""
@@ -431,7 +785,11 @@ Provide a brief, elegant summary. Don't repeat the full code - just confirm what
 
     def close(self):
         """Clean up resources."""
-        self.memory.close()
+        self._executor.shutdown(wait=False)
+        # Drain pending conversation writes before releasing memory
+        self._writer.shutdown(wait=True)
+        if self._memory_shared:
+            release_shared_memory()
 
 
 # Convenience functions